@@ -1176,6 +1176,7 @@ async def handle_schedule_commands(args) -> int:
 
 async def execute_pending_transactions() -> int:
     """Manually execute pending scheduled transactions."""
+    scheduler_service = None
     try:
         # Create agent to get scheduler service
         factory = get_default_factory()
@@ -1233,6 +1234,10 @@ async def execute_pending_transactions() -> int:
     except Exception as e:
         print(f"❌ Error executing pending transactions: {e}")
         return 1
+    finally:
+        # The build started the service; stopping it delivers queued events and writes
+        if scheduler_service:
+            await scheduler_service.stop()
 
 
 async def main() -> int:
@@ -87,8 +87,6 @@ class SchedulerDaemon:
     
     async def _create_minimal_tool_registry(self) -> ToolRegistry:
         """Create a minimal tool registry with only the tools needed for scheduled transactions."""
-        from ..core.tools import ToolRegistry
-        
         registry = ToolRegistry()
         
         # Import and register only the tools that can be scheduled
@@ -96,28 +94,24 @@ class SchedulerDaemon:
             # Solana tools (for transfers)
             from ..integrations.solana.solana_tools import create_solana_tools
             solana_tools = create_solana_tools()
-            for tool in solana_tools:
-                registry.register(tool)
+            registry.register_many(solana_tools)
             
             # Pump.fun tools
             from ..integrations.pump_fun import create_pump_fun_tools
             pump_tools = create_pump_fun_tools()
-            for tool in pump_tools:
-                registry.register(tool)
+            registry.register_many(pump_tools)
             
             # Jupiter tools
             from ..integrations.jupiter import create_jupiter_tools
             jupiter_tools = create_jupiter_tools()
-            for tool in jupiter_tools:
-                registry.register(tool)
+            registry.register_many(jupiter_tools)
             
             # Aster futures tools (if enabled)
             if Settings.ENABLE_ASTER_FUTURES_TOOLS:
                 try:
                     from ..integrations.aster_futures import create_aster_futures_tools
                     aster_tools = create_aster_futures_tools()
-                    for tool in aster_tools:
-                        registry.register(tool)
+                    registry.register_many(aster_tools)
                 except Exception as e:
                     logger.warning(f"Failed to load Aster futures tools: {e}")
             
@@ -125,8 +119,7 @@ class SchedulerDaemon:
             try:
                 from ..integrations.smart_trader import SmartTrader, create_smart_trader_tools
                 trader = SmartTrader(pump_tools, jupiter_tools, solana_tools)
-                for tool in create_smart_trader_tools(trader):
-                    registry.register(tool)
+                registry.register_many(create_smart_trader_tools(trader))
             except Exception as e:
                 logger.warning(f"Failed to load smart trader tools: {e}")
             
@@ -771,4 +771,12 @@ Respond with just the bullet points, no preamble."""
         except Exception:
             pass
 
+        # Stop the scheduler so queued outcome events and writes are flushed
+        try:
+            scheduler_service = getattr(self, "_scheduler_service", None)
+            if scheduler_service:
+                await scheduler_service.stop()
+        except Exception:
+            pass
+
         # Nothing to do for ToolRegistry/memory; shared utilities have their own cleanup
@@ -375,34 +375,28 @@ class AgentBuilder:
 
         # Register integrations behind flags
         if Settings.ENABLE_SOLANA_TOOLS:
-            for tool in create_solana_tools(solana_tools, agent=agent):
-                tools.register(tool)
+            tools.register_many(create_solana_tools(solana_tools, agent=agent))
 
         pump_tools = PumpFunTools(solana_tools)
         if Settings.ENABLE_PUMP_FUN_TOOLS:
-            for tool in create_pump_fun_tools(pump_tools, agent=agent):
-                tools.register(tool)
+            tools.register_many(create_pump_fun_tools(pump_tools, agent=agent))
 
         dex_tools = DexScreenerTools()
         if Settings.ENABLE_DEXSCREENER_TOOLS:
-            for tool in create_dexscreener_tools(dex_tools):
-                tools.register(tool)
+            tools.register_many(create_dexscreener_tools(dex_tools))
 
         jupiter_tools = JupiterTools(solana_tools)
         if Settings.ENABLE_JUPITER_TOOLS:
-            for tool in create_jupiter_tools(jupiter_tools):
-                tools.register(tool)
+            tools.register_many(create_jupiter_tools(jupiter_tools))
 
         brave_api_key = os.getenv("BRAVE_API_KEY")
         search_tools = SearchTools(api_key=brave_api_key)
         if Settings.ENABLE_SEARCH_TOOLS:
-            for tool in create_search_tools(search_tools):
-                tools.register(tool)
+            tools.register_many(create_search_tools(search_tools))
 
         polymarket_tools = PolymarketTools()
         if Settings.ENABLE_POLYMARKET_TOOLS:
-            for tool in create_polymarket_tools(polymarket_tools):
-                tools.register(tool)
+            tools.register_many(create_polymarket_tools(polymarket_tools))
 
         aster_client: Optional[AsterFuturesClient] = None
         if Settings.ENABLE_ASTER_FUTURES_TOOLS:
@@ -427,8 +421,7 @@ class AgentBuilder:
                     api_secret=aster_api_secret,
                     default_recv_window=Settings.ASTER_DEFAULT_RECV_WINDOW,
                 )
-                for tool in create_aster_futures_tools(aster_client):
-                    tools.register(tool)
+                tools.register_many(create_aster_futures_tools(aster_client))
             else:
                 logger.warning(
                     "Aster futures tools enabled but API key/secret are missing. "
@@ -444,8 +437,7 @@ class AgentBuilder:
         # Smart trader (pump.fun -> Jupiter fallback)
         try:
             trader = SmartTrader(pump_tools, jupiter_tools, solana_tools)
-            for tool in create_smart_trader_tools(trader):
-                tools.register(tool)
+            tools.register_many(create_smart_trader_tools(trader))
         except Exception as e:
             logger.warning(f"Failed to register smart trader tools: {e}")
 
@@ -458,12 +450,10 @@ class AgentBuilder:
             scheduler_service.set_tool_registry(tools)
             
             # Register scheduler tools
-            for tool in create_scheduler_tools(scheduler_service):
-                tools.register(tool)
+            tools.register_many(create_scheduler_tools(scheduler_service))
             
             # Register time calculation tools
-            for tool in create_time_tools():
-                tools.register(tool)
+            tools.register_many(create_time_tools())
             
             # Start the scheduler service
             await scheduler_service.start()
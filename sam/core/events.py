@@ -1,6 +1,7 @@
+import asyncio
 import logging
 from collections import defaultdict
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +13,8 @@ class EventBus:
 
     def __init__(self) -> None:
         self._subs: Dict[str, List[Subscriber]] = defaultdict(list)
+        # Publishes started by publish_nowait, kept until done so drain() can await them
+        self._pending: Set[asyncio.Task] = set()
 
     def subscribe(self, event: str, handler: Subscriber) -> None:
         self._subs[event].append(handler)
@@ -38,6 +41,33 @@ class EventBus:
             except Exception as e:
                 logger.warning(f"Event handler error for {event}: {e}")
 
+    def publish_nowait(self, event: str, payload: Dict[str, Any]) -> None:
+        """Publish from a background task so the caller does not wait on handlers.
+
+        Must be called from a running event loop. Use ``drain`` to wait for delivery.
+        """
+        task = asyncio.create_task(self.publish(event, payload))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        """Wait until every publish started by ``publish_nowait`` has finished."""
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    async def publish_many(self, events: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Publish several events in order, looking up each event's handlers once."""
+        handlers_by_event: Dict[str, List[Subscriber]] = {}
+        for event, payload in events:
+            handlers = handlers_by_event.get(event)
+            if handlers is None:
+                handlers = handlers_by_event[event] = list(self._subs.get(event, []))
+            for h in handlers:
+                try:
+                    await h(event, payload)
+                except Exception as e:
+                    logger.warning(f"Event handler error for {event}: {e}")
+
 
 # Global bus for convenience (optional; hosts may provide their own)
 _global_bus: Optional[EventBus] = None
@@ -69,8 +69,7 @@ class FuturesAgentBuilder:
         aster_client = await self._setup_aster_client()
         if aster_client:
             # Register Aster futures tools
-            for tool in create_aster_futures_tools(aster_client):
-                tools.register(tool)
+            tools.register_many(create_aster_futures_tools(aster_client))
             
             # Store client reference
             setattr(agent, "_aster_client", aster_client)
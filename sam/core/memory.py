@@ -4,7 +4,7 @@ import asyncio
 import json
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, cast
 
 from ..utils.connection_pool import get_db_connection
@@ -113,6 +113,7 @@ class MemoryManager:
                             status TEXT NOT NULL DEFAULT 'pending',
                             created_at TEXT NOT NULL,
                             next_execution TEXT,
+                            next_execution_us INTEGER,
                             last_execution TEXT,
                             execution_count INTEGER DEFAULT 0,
                             max_executions INTEGER,
@@ -120,10 +121,49 @@ class MemoryManager:
                             metadata TEXT
                         )
                     """)
-                    
+
+                    # Integer copy of next_execution (UTC epoch microseconds) for the due-time scan
+                    cursor = await conn.execute("PRAGMA table_info(scheduled_transactions)")
+                    columns = [row[1] for row in await cursor.fetchall()]
+                    if "next_execution_us" not in columns:
+                        await conn.execute(
+                            "ALTER TABLE scheduled_transactions ADD COLUMN next_execution_us INTEGER"
+                        )
+                    # Runs on every start so rows written without the integer copy (older
+                    # builds sharing the DB) still reach the due-time scan
+                    cursor = await conn.execute(
+                        "SELECT id, next_execution FROM scheduled_transactions "
+                        "WHERE next_execution_us IS NULL AND next_execution IS NOT NULL"
+                    )
+                    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+                    backfill = []
+                    for row_id, next_execution in await cursor.fetchall():
+                        try:
+                            dt = datetime.fromisoformat(next_execution)
+                        except (TypeError, ValueError):
+                            logger.warning(
+                                f"Scheduled transaction {row_id} has unparseable next_execution "
+                                f"{next_execution!r}; it will not be picked up by the scheduler"
+                            )
+                            continue
+                        if dt.tzinfo is None:
+                            dt = dt.replace(tzinfo=timezone.utc)
+                        backfill.append(((dt - epoch) // timedelta(microseconds=1), row_id))
+                    if backfill:
+                        await conn.executemany(
+                            "UPDATE scheduled_transactions SET next_execution_us = ? WHERE id = ?",
+                            backfill,
+                        )
+
                     # Create indexes for scheduled_transactions
+                    # User listings filter on status and page by created_at; these replace
+                    # the plain user_id index so neither needs a sort step
+                    await conn.execute("DROP INDEX IF EXISTS idx_scheduled_transactions_user")
+                    await conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_scheduled_transactions_user_created ON scheduled_transactions(user_id, created_at)"
+                    )
                     await conn.execute(
-                        "CREATE INDEX IF NOT EXISTS idx_scheduled_transactions_user ON scheduled_transactions(user_id)"
+                        "CREATE INDEX IF NOT EXISTS idx_scheduled_transactions_user_status_created ON scheduled_transactions(user_id, status, created_at)"
                     )
                     await conn.execute(
                         "CREATE INDEX IF NOT EXISTS idx_scheduled_transactions_next_execution ON scheduled_transactions(next_execution)"
@@ -131,6 +171,9 @@ class MemoryManager:
                     await conn.execute(
                         "CREATE INDEX IF NOT EXISTS idx_scheduled_transactions_status ON scheduled_transactions(status)"
                     )
+                    await conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_scheduled_transactions_due ON scheduled_transactions(status, next_execution_us)"
+                    )
 
                     # Create secure_data table
                     await conn.execute("""
@@ -1,6 +1,8 @@
 """Scheduler module for SAM framework."""
 
 from .models import (
+    ALLOWED_TOOLS,
+    AnyScheduleConfig,
     CancelScheduledTransactionInput,
     ConditionalScheduleConfig,
     ListScheduledTransactionsInput,
@@ -21,11 +23,13 @@ __all__ = [
     "ListScheduledTransactionsInput", 
     "CancelScheduledTransactionInput",
     "ScheduleConfig",
+    "AnyScheduleConfig",
     "OnceScheduleConfig",
     "RecurringScheduleConfig",
     "ConditionalScheduleConfig",
     "ScheduleType",
     "TransactionStatus",
+    "ALLOWED_TOOLS",
     "RecurrenceFrequency",
     "SchedulerService",
 ]
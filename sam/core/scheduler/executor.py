@@ -2,17 +2,158 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from ..tools import ToolRegistry
+import base58
+
+from ..tools import ToolRegistry, ToolResult
 from ..events import EventBus
-from .models import ScheduledTransaction
+from .models import ScheduledTransaction, _event_timestamps
 
 logger = logging.getLogger(__name__)
 
+# Events buffered before emitters wait for the flusher, and most sent per flush
+_EVENT_QUEUE_SIZE = 256
+_EVENT_BATCH_SIZE = 64
+# Safety limit for SOL-denominated buys and transfers
+_MAX_SOL_AMOUNT = 1000
+# Types accepted for numeric parameters (bool passes as an int subclass, as before)
+_NUMERIC: Tuple[type, ...] = (int, float)
+
+
+def _is_solana_address(value: Any) -> bool:
+    """Check that a value is a base58 string decoding to a 32-byte public key."""
+    # 32 bytes encode to 32-44 base58 characters; reject anything else before decoding
+    if not isinstance(value, str) or not 32 <= len(value) <= 44:
+        return False
+    return _decodes_to_public_key(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _decodes_to_public_key(value: str) -> bool:
+    """Base58-decode an address string; cached since recurring schedules reuse mints."""
+    try:
+        return len(base58.b58decode(value)) == 32
+    except ValueError:
+        return False
+
+
+def _is_number(value: Any) -> bool:
+    """Check for an int or float parameter value."""
+    return isinstance(value, _NUMERIC)
+
+
+def _is_positive_number(value: Any) -> bool:
+    """Check for a number greater than zero."""
+    return _is_number(value) and value > 0
+
+
+# A validation spec is (required fields, checks). Each check is (field, predicate,
+# error) and runs only when the field is present; the first failing check wins, so
+# a range check listed after a type check may assume the type.
+_Check = Tuple[str, Callable[[Any], bool], str]
+_Spec = Tuple[Tuple[str, ...], Tuple[_Check, ...]]
+
+_BUY_SPEC: _Spec = (
+    ("mint", "amount_sol"),
+    (
+        ("amount_sol", _is_positive_number, "amount_sol must be a positive number"),
+        ("amount_sol", lambda v: v <= _MAX_SOL_AMOUNT, f"amount_sol exceeds maximum limit of {_MAX_SOL_AMOUNT} SOL"),
+        ("mint", _is_solana_address, "Invalid mint address format"),
+    ),
+)
+
+_SELL_SPEC: _Spec = (
+    ("mint", "percentage"),
+    (
+        ("percentage", lambda v: _is_number(v) and 0 < v <= 100, "percentage must be between 0 and 100"),
+        ("mint", _is_solana_address, "Invalid mint address format"),
+    ),
+)
+
+_SWAP_SPEC: _Spec = (
+    ("input_mint", "output_mint", "amount"),
+    (
+        ("amount", _is_positive_number, "amount must be a positive number"),
+        ("input_mint", _is_solana_address, "Invalid input_mint format"),
+        ("output_mint", _is_solana_address, "Invalid output_mint format"),
+    ),
+)
+
+_TRANSFER_SPEC: _Spec = (
+    ("to_address", "amount"),
+    (
+        ("amount", _is_positive_number, "amount must be a positive number"),
+        ("amount", lambda v: v <= _MAX_SOL_AMOUNT, f"amount exceeds maximum limit of {_MAX_SOL_AMOUNT} SOL"),
+        ("to_address", _is_solana_address, "Invalid to_address format"),
+    ),
+)
+
+_ASTER_SPEC: _Spec = (
+    ("symbol",),
+    (
+        ("symbol", lambda v: isinstance(v, str) and bool(v), "symbol must be a non-empty string"),
+        # usd_notional and leverage only apply to opening positions
+        ("usd_notional", _is_positive_number, "usd_notional must be a positive number"),
+        ("leverage", lambda v: _is_number(v) and 1 <= v <= 20, "leverage must be between 1 and 20"),
+    ),
+)
+
+
+def _run_spec(parameters: Dict[str, Any], spec: _Spec) -> Optional[Dict[str, Any]]:
+    """Check parameters against a validation spec, returning the first error."""
+    required, checks = spec
+    for field in required:
+        if field not in parameters:
+            return {"error": f"Missing required parameter: {field}"}
+
+    for field, predicate, error in checks:
+        if field in parameters and not predicate(parameters[field]):
+            return {"error": error}
+
+    return None
+
+
+def _validate_buy_parameters(parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Validate buy transaction parameters."""
+    return _run_spec(parameters, _BUY_SPEC)
+
+
+def _validate_sell_parameters(parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Validate sell transaction parameters."""
+    return _run_spec(parameters, _SELL_SPEC)
+
+
+def _validate_swap_parameters(parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Validate swap transaction parameters."""
+    return _run_spec(parameters, _SWAP_SPEC)
+
+
+def _validate_transfer_parameters(parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Validate transfer transaction parameters."""
+    return _run_spec(parameters, _TRANSFER_SPEC)
+
+
+def _validate_aster_parameters(parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Validate Aster futures transaction parameters."""
+    return _run_spec(parameters, _ASTER_SPEC)
+
+
+# Tool name -> parameter validator; tools without an entry are not checked
+_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = {
+    "smart_buy": _validate_buy_parameters,
+    "pump_fun_buy": _validate_buy_parameters,
+    "smart_sell": _validate_sell_parameters,
+    "pump_fun_sell": _validate_sell_parameters,
+    "jupiter_swap": _validate_swap_parameters,
+    "transfer_sol": _validate_transfer_parameters,
+    "aster_open_long": _validate_aster_parameters,
+    "aster_close_position": _validate_aster_parameters,
+}
+
 
 class ScheduledTransactionExecutor:
     """Executes scheduled transactions using existing tools."""
@@ -20,42 +161,124 @@ class ScheduledTransactionExecutor:
     def __init__(self, tool_registry: ToolRegistry, event_bus: EventBus):
         self.tool_registry = tool_registry
         self.event_bus = event_bus
-
-    async def execute_transaction(self, transaction: ScheduledTransaction) -> Dict[str, Any]:
-        """Execute a scheduled transaction using the appropriate tool."""
+        # Outcome events are queued and published in batches while the flusher runs
+        self._events: asyncio.Queue = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def start_event_flusher(self) -> None:
+        """Start publishing outcome events from a background batch task."""
+        if self._flush_task is None or self._flush_task.done():
+            # A task that is already done was cancelled with a closed event loop,
+            # which its queue is bound to
+            self._events = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+            self._flush_task = asyncio.create_task(self._flush_events())
+
+    async def stop_event_flusher(self) -> None:
+        """Publish any queued or in-flight events and stop the background task."""
+        await self.event_bus.drain()
+        task, self._flush_task = self._flush_task, None
+        if task is None:
+            return
+        await self._events.put(None)
+        await task
+        # Emitters that were blocked on a full queue may have landed after the sentinel
+        leftovers = []
+        while not self._events.empty():
+            item = self._events.get_nowait()
+            if item is not None:
+                leftovers.append(item)
+        if leftovers:
+            await self.event_bus.publish_many(leftovers)
+
+    async def _emit(self, batched: bool, event: str, payload: Dict[str, Any]) -> None:
+        """Publish an outcome event.
+
+        Batched events go to the flusher's queue when it is running, so the caller
+        does not wait on handlers. Anything else is published inline, because nothing
+        would otherwise wait for its delivery before the process exits.
+        """
+        if batched and self._flush_task is not None and not self._flush_task.done():
+            await self._events.put((event, payload))
+        else:
+            await self.event_bus.publish(event, payload)
+
+    async def _flush_events(self) -> None:
+        """Drain queued events, publishing up to a batch at a time."""
+        while True:
+            item = await self._events.get()
+            if item is None:
+                return
+            batch = [item]
+            stopping = False
+            while len(batch) < _EVENT_BATCH_SIZE and not self._events.empty():
+                item = self._events.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                await self.event_bus.publish_many(batch)
+            except Exception as e:
+                logger.warning(f"Failed to publish {len(batch)} scheduler events: {e}")
+            if stopping:
+                return
+
+    async def execute_transaction(
+        self,
+        transaction: ScheduledTransaction,
+        *,
+        validated: bool = False,
+        batch_events: bool = False,
+    ) -> Dict[str, Any]:
+        """Execute a scheduled transaction using the appropriate tool.
+
+        Pass ``validated=True`` when ``can_execute_transaction`` already accepted this
+        transaction, to skip validating its parameters a second time. ``batch_events``
+        lets the outcome event join the flusher's queue; only the scheduler loop sets
+        it, since its owner stops the flusher and so delivers whatever is queued.
+        """
         logger.info(f"Executing scheduled transaction {transaction.id}: {transaction.tool_name}")
+        # Event time, read once for either outcome
+        timestamps = _event_timestamps()
 
         try:
             # Get the tool handler
-            tool = self.tool_registry._tools.get(transaction.tool_name)
+            tool = self.tool_registry.get_tool(transaction.tool_name)
             if not tool:
                 error_msg = f"Tool {transaction.tool_name} not found"
                 logger.error(error_msg)
                 return {"error": error_msg}
 
             # Validate parameters
-            validation_result = self._validate_parameters(transaction)
-            if validation_result:
-                return validation_result
+            if not validated:
+                validation_result = self._validate_parameters(transaction)
+                if validation_result:
+                    return validation_result
 
             # Execute the tool
             logger.info(f"Executing tool {transaction.tool_name} with parameters: {transaction.parameters}")
             result = await tool.handler(transaction.parameters)
 
-            # Check if execution was successful
-            if isinstance(result, dict) and result.get("error"):
+            # Check if execution was successful; typed results carry the outcome as a flag
+            if isinstance(result, ToolResult):
+                if not result.success:
+                    error_msg = f"Tool execution failed: {result.error}"
+                    logger.error(error_msg)
+                    return {"error": error_msg}
+                result = result.to_dict()
+            elif isinstance(result, dict) and result.get("error"):
                 error_msg = f"Tool execution failed: {result['error']}"
                 logger.error(error_msg)
                 return {"error": error_msg}
 
             # Emit success event
-            await self.event_bus.publish("scheduler.transaction_executed", {
+            await self._emit(batch_events, "scheduler.transaction_executed", {
                 "transaction_id": transaction.id,
                 "user_id": transaction.user_id,
                 "tool_name": transaction.tool_name,
                 "parameters": transaction.parameters,
                 "result": result,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                **timestamps,
             })
 
             logger.info(f"Successfully executed transaction {transaction.id}")
@@ -66,13 +289,13 @@ class ScheduledTransactionExecutor:
             logger.error(f"Failed to execute transaction {transaction.id}: {e}")
 
             # Emit error event
-            await self.event_bus.publish("scheduler.transaction_failed", {
+            await self._emit(batch_events, "scheduler.transaction_failed", {
                 "transaction_id": transaction.id,
                 "user_id": transaction.user_id,
                 "tool_name": transaction.tool_name,
                 "parameters": transaction.parameters,
                 "error": error_msg,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                **timestamps,
             })
 
             return {"error": error_msg}
@@ -85,133 +308,25 @@ class ScheduledTransactionExecutor:
                 return {"error": "No parameters provided"}
 
             # Tool-specific validation
-            if transaction.tool_name in ["smart_buy", "pump_fun_buy"]:
-                return self._validate_buy_parameters(transaction.parameters)
-            elif transaction.tool_name in ["smart_sell", "pump_fun_sell"]:
-                return self._validate_sell_parameters(transaction.parameters)
-            elif transaction.tool_name == "jupiter_swap":
-                return self._validate_swap_parameters(transaction.parameters)
-            elif transaction.tool_name == "transfer_sol":
-                return self._validate_transfer_parameters(transaction.parameters)
-            elif transaction.tool_name in ["aster_open_long", "aster_close_position"]:
-                return self._validate_aster_parameters(transaction.parameters)
-
-            return None
+            validator = _VALIDATORS.get(transaction.tool_name)
+            return validator(transaction.parameters) if validator else None
 
         except Exception as e:
             logger.error(f"Parameter validation failed: {e}")
             return {"error": f"Parameter validation failed: {str(e)}"}
 
-    def _validate_buy_parameters(self, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Validate buy transaction parameters."""
-        required_fields = ["mint", "amount_sol"]
-        for field in required_fields:
-            if field not in parameters:
-                return {"error": f"Missing required parameter: {field}"}
-
-        # Validate amount
-        amount_sol = parameters.get("amount_sol")
-        if not isinstance(amount_sol, (int, float)) or amount_sol <= 0:
-            return {"error": "amount_sol must be a positive number"}
-
-        if amount_sol > 1000:  # Safety limit
-            return {"error": "amount_sol exceeds maximum limit of 1000 SOL"}
-
-        # Validate mint address
-        mint = parameters.get("mint")
-        if not isinstance(mint, str) or len(mint) != 44:
-            return {"error": "Invalid mint address format"}
-
-        return None
-
-    def _validate_sell_parameters(self, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Validate sell transaction parameters."""
-        required_fields = ["mint", "percentage"]
-        for field in required_fields:
-            if field not in parameters:
-                return {"error": f"Missing required parameter: {field}"}
-
-        # Validate percentage
-        percentage = parameters.get("percentage")
-        if not isinstance(percentage, (int, float)) or not (0 < percentage <= 100):
-            return {"error": "percentage must be between 0 and 100"}
-
-        # Validate mint address
-        mint = parameters.get("mint")
-        if not isinstance(mint, str) or len(mint) != 44:
-            return {"error": "Invalid mint address format"}
-
-        return None
-
-    def _validate_swap_parameters(self, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Validate swap transaction parameters."""
-        required_fields = ["input_mint", "output_mint", "amount"]
-        for field in required_fields:
-            if field not in parameters:
-                return {"error": f"Missing required parameter: {field}"}
-
-        # Validate amount
-        amount = parameters.get("amount")
-        if not isinstance(amount, (int, float)) or amount <= 0:
-            return {"error": "amount must be a positive number"}
-
-        # Validate mint addresses
-        for field in ["input_mint", "output_mint"]:
-            mint = parameters.get(field)
-            if not isinstance(mint, str) or len(mint) != 44:
-                return {"error": f"Invalid {field} format"}
-
-        return None
-
-    def _validate_transfer_parameters(self, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Validate transfer transaction parameters."""
-        required_fields = ["to_address", "amount"]
-        for field in required_fields:
-            if field not in parameters:
-                return {"error": f"Missing required parameter: {field}"}
-
-        # Validate amount
-        amount = parameters.get("amount")
-        if not isinstance(amount, (int, float)) or amount <= 0:
-            return {"error": "amount must be a positive number"}
-
-        if amount > 1000:  # Safety limit
-            return {"error": "amount exceeds maximum limit of 1000 SOL"}
-
-        # Validate address
-        to_address = parameters.get("to_address")
-        if not isinstance(to_address, str) or len(to_address) != 44:
-            return {"error": "Invalid to_address format"}
-
-        return None
-
-    def _validate_aster_parameters(self, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Validate Aster futures transaction parameters."""
-        if "symbol" not in parameters:
-            return {"error": "Missing required parameter: symbol"}
-
-        symbol = parameters.get("symbol")
-        if not isinstance(symbol, str) or not symbol:
-            return {"error": "symbol must be a non-empty string"}
-
-        # For open_long, validate usd_notional and leverage
-        if "usd_notional" in parameters:
-            usd_notional = parameters.get("usd_notional")
-            if not isinstance(usd_notional, (int, float)) or usd_notional <= 0:
-                return {"error": "usd_notional must be a positive number"}
-
-        if "leverage" in parameters:
-            leverage = parameters.get("leverage")
-            if not isinstance(leverage, (int, float)) or not (1 <= leverage <= 20):
-                return {"error": "leverage must be between 1 and 20"}
-
-        return None
+    # Kept as attributes for callers that validate one tool kind directly
+    _validate_buy_parameters = staticmethod(_validate_buy_parameters)
+    _validate_sell_parameters = staticmethod(_validate_sell_parameters)
+    _validate_swap_parameters = staticmethod(_validate_swap_parameters)
+    _validate_transfer_parameters = staticmethod(_validate_transfer_parameters)
+    _validate_aster_parameters = staticmethod(_validate_aster_parameters)
 
     async def can_execute_transaction(self, transaction: ScheduledTransaction) -> bool:
         """Check if a transaction can be executed (pre-flight checks)."""
         try:
             # Check if tool exists
-            tool = self.tool_registry._tools.get(transaction.tool_name)
+            tool = self.tool_registry.get_tool(transaction.tool_name)
             if not tool:
                 logger.warning(f"Tool {transaction.tool_name} not available")
                 return False
@@ -4,14 +4,66 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import datetime, timezone
+import re
+import time
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON codec for stored rows
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Same inputs strptime("%H:%M") accepts: 1-2 digit hour 0-23 and minute 0-59
+_HHMM_RE = re.compile(r"\A([01]?\d|2[0-3]):[0-5]?\d\Z")
+
+# Tools that can be scheduled
+ALLOWED_TOOLS: frozenset[str] = frozenset({
+    "smart_buy", "smart_sell", "jupiter_swap", "transfer_sol",
+    "pump_fun_buy", "pump_fun_sell", "aster_open_long", "aster_close_position",
+})
+
+# scheduled_transactions columns in the order ScheduledTransaction.from_row reads them
+TRANSACTION_COLUMNS: Tuple[str, ...] = (
+    "id", "user_id", "transaction_type", "tool_name", "parameters", "schedule_type",
+    "schedule_config", "status", "created_at", "next_execution", "last_execution",
+    "execution_count", "max_executions", "error_message", "metadata",
+)
+
+# From this many rows, from_rows parses each JSON column with one call over the whole batch
+_BATCH_PARSE_MIN_ROWS = 32
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a row field to JSON text, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(text: str) -> Any:
+    """Parse a JSON row field, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _event_timestamps() -> Dict[str, Any]:
+    """Event time fields from one clock read: ISO 8601 ``timestamp`` and UTC epoch ``timestamp_ms``."""
+    now_us = time.time_ns() // 1_000
+    return {
+        "timestamp": (_EPOCH + timedelta(microseconds=now_us)).isoformat(),
+        "timestamp_ms": now_us // 1_000,
+    }
+
 
 class ScheduleType(str, Enum):
     """Types of scheduling supported."""
@@ -48,12 +100,14 @@ class ConditionalOperator(str, Enum):
 
 class ScheduleConfig(BaseModel):
     """Base class for schedule configurations."""
+    model_config = ConfigDict(frozen=True)
+
     schedule_type: ScheduleType
 
 
 class OnceScheduleConfig(ScheduleConfig):
     """Configuration for one-time execution."""
-    schedule_type: ScheduleType = ScheduleType.ONCE
+    schedule_type: Literal[ScheduleType.ONCE] = ScheduleType.ONCE
     execute_at: datetime = Field(..., description="When to execute the transaction")
 
     @field_validator("execute_at", mode="before")
@@ -62,12 +116,9 @@ class OnceScheduleConfig(ScheduleConfig):
         """Parse execute_at from string or datetime."""
         if isinstance(v, str):
             try:
-                # Handle ISO format strings
-                if v.endswith('Z'):
-                    v = v[:-1] + '+00:00'
                 return datetime.fromisoformat(v)
-            except ValueError:
-                raise ValueError(f"Invalid datetime format: {v}")
+            except ValueError as e:
+                raise ValueError(f"Invalid datetime format: {v}") from e
         elif isinstance(v, datetime):
             return v
         else:
@@ -85,7 +136,7 @@ class OnceScheduleConfig(ScheduleConfig):
 
 class RecurringScheduleConfig(ScheduleConfig):
     """Configuration for recurring execution."""
-    schedule_type: ScheduleType = ScheduleType.RECURRING
+    schedule_type: Literal[ScheduleType.RECURRING] = ScheduleType.RECURRING
     frequency: RecurrenceFrequency = Field(..., description="How often to execute")
     time: Optional[str] = Field(None, description="Time of day (HH:MM format)")
     days_of_week: Optional[List[int]] = Field(None, description="Days of week (1=Monday, 7=Sunday)")
@@ -102,12 +153,9 @@ class RecurringScheduleConfig(ScheduleConfig):
             return None
         if isinstance(v, str):
             try:
-                # Handle ISO format strings
-                if v.endswith('Z'):
-                    v = v[:-1] + '+00:00'
                 return datetime.fromisoformat(v)
-            except ValueError:
-                raise ValueError(f"Invalid datetime format: {v}")
+            except ValueError as e:
+                raise ValueError(f"Invalid datetime format: {v}") from e
         elif isinstance(v, datetime):
             return v
         else:
@@ -119,11 +167,9 @@ class RecurringScheduleConfig(ScheduleConfig):
         """Validate time format."""
         if v is None:
             return v
-        try:
-            datetime.strptime(v, "%H:%M")
-            return v
-        except ValueError:
+        if _HHMM_RE.match(v) is None:
             raise ValueError("time must be in HH:MM format")
+        return v
 
     @field_validator("days_of_week")
     @classmethod
@@ -148,7 +194,7 @@ class RecurringScheduleConfig(ScheduleConfig):
 
 class ConditionalScheduleConfig(ScheduleConfig):
     """Configuration for conditional execution."""
-    schedule_type: ScheduleType = ScheduleType.CONDITIONAL
+    schedule_type: Literal[ScheduleType.CONDITIONAL] = ScheduleType.CONDITIONAL
     condition_type: str = Field(..., description="Type of condition (e.g., 'price_target')")
     condition_config: Dict[str, Any] = Field(..., description="Condition-specific configuration")
     check_interval: int = Field(300, description="How often to check condition (seconds)")
@@ -163,14 +209,26 @@ class ConditionalScheduleConfig(ScheduleConfig):
         return v
 
 
+# Any schedule config, selected by its schedule_type
+AnyScheduleConfig = Annotated[
+    Union[OnceScheduleConfig, RecurringScheduleConfig, ConditionalScheduleConfig],
+    Field(discriminator="schedule_type"),
+]
+
+# Built once; validating through it dispatches on schedule_type in pydantic-core
+_SCHEDULE_CONFIG_ADAPTER: TypeAdapter[AnyScheduleConfig] = TypeAdapter(AnyScheduleConfig)
+
+
 class ScheduledTransaction(BaseModel):
     """Model for a scheduled transaction."""
+    model_config = ConfigDict(frozen=True)
+
     id: Optional[int] = Field(None, description="Database ID")
     user_id: str = Field(..., description="User who scheduled the transaction")
     transaction_type: str = Field(..., description="Type of transaction (e.g., 'buy', 'sell', 'transfer')")
     tool_name: str = Field(..., description="Name of the tool to execute")
     parameters: Dict[str, Any] = Field(..., description="Parameters for the tool")
-    schedule_config: Union[OnceScheduleConfig, RecurringScheduleConfig, ConditionalScheduleConfig] = Field(
+    schedule_config: AnyScheduleConfig = Field(
         ..., description="Schedule configuration"
     )
     status: TransactionStatus = Field(TransactionStatus.PENDING, description="Current status")
@@ -186,12 +244,7 @@ class ScheduledTransaction(BaseModel):
     @classmethod
     def validate_tool_name(cls, v: str) -> str:
         """Validate tool name."""
-        # List of known tools that can be scheduled
-        allowed_tools = {
-            "smart_buy", "smart_sell", "jupiter_swap", "transfer_sol",
-            "pump_fun_buy", "pump_fun_sell", "aster_open_long", "aster_close_position"
-        }
-        if v not in allowed_tools:
+        if v not in ALLOWED_TOOLS:
             logger.warning(f"Unknown tool name: {v}")
         return v
 
@@ -205,17 +258,15 @@ class ScheduledTransaction(BaseModel):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database storage."""
-        # Convert schedule config to dict and ensure all datetime objects are strings
-        schedule_config_dict = self.schedule_config.model_dump()
-        schedule_config_dict = self._convert_datetime_to_string(schedule_config_dict)
-        
         return {
             "user_id": self.user_id,
             "transaction_type": self.transaction_type,
             "tool_name": self.tool_name,
-            "parameters": json.dumps(self.parameters),
+            "parameters": _json_dumps(self.parameters),
             "schedule_type": self.schedule_config.schedule_type.value,
-            "schedule_config": json.dumps(schedule_config_dict),
+            # Serialized by pydantic's core straight to JSON text; datetimes and enums,
+            # including nested ones, come out as strings
+            "schedule_config": self.schedule_config.model_dump_json(),
             "status": self.status.value,
             "created_at": self.created_at.isoformat(),
             "next_execution": self.next_execution.isoformat() if self.next_execution else None,
@@ -223,51 +274,68 @@ class ScheduledTransaction(BaseModel):
             "execution_count": self.execution_count,
             "max_executions": self.max_executions,
             "error_message": self.error_message,
-            "metadata": json.dumps(self.metadata) if self.metadata else None,
+            "metadata": _json_dumps(self.metadata) if self.metadata else None,
         }
     
-    def _convert_datetime_to_string(self, obj: Any) -> Any:
-        """Recursively convert datetime objects to ISO strings."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, dict):
-            return {key: self._convert_datetime_to_string(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_datetime_to_string(item) for item in obj]
-        else:
-            return obj
-
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> ScheduledTransaction:
         """Create from dictionary loaded from database."""
-        # Parse schedule config based on type
-        schedule_type = ScheduleType(data["schedule_type"])
-        schedule_config_data = json.loads(data["schedule_config"])
-        
-        if schedule_type == ScheduleType.ONCE:
-            schedule_config = OnceScheduleConfig(**schedule_config_data)
-        elif schedule_type == ScheduleType.RECURRING:
-            schedule_config = RecurringScheduleConfig(**schedule_config_data)
-        elif schedule_type == ScheduleType.CONDITIONAL:
-            schedule_config = ConditionalScheduleConfig(**schedule_config_data)
-        else:
-            raise ValueError(f"Unknown schedule type: {schedule_type}")
+        return cls.from_row((data.get("id"), *(data[column] for column in TRANSACTION_COLUMNS[1:])))
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]]) -> List[ScheduledTransaction]:
+        """Create from database rows selected in ``TRANSACTION_COLUMNS`` order.
+
+        Large batches parse the ``parameters`` and ``metadata`` columns as one JSON
+        array each instead of one parse call per row.
+        """
+        if len(rows) < _BATCH_PARSE_MIN_ROWS:
+            return [cls.from_row(row) for row in rows]
+        parameters = _json_loads("[" + ",".join(row[4] for row in rows) + "]")
+        metadata = _json_loads("[" + ",".join(row[14] or "null" for row in rows) + "]")
+        return [cls._from_parsed_row(*fields) for fields in zip(rows, parameters, metadata)]
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> ScheduledTransaction:
+        """Create from a database row selected in ``TRANSACTION_COLUMNS`` order."""
+        return cls._from_parsed_row(
+            row, _json_loads(row[4]), _json_loads(row[14]) if row[14] else None
+        )
+
+    @classmethod
+    def _from_parsed_row(
+        cls, row: Sequence[Any], parameters: Dict[str, Any], metadata: Optional[Dict[str, Any]]
+    ) -> ScheduledTransaction:
+        """Create from a row whose JSON ``parameters`` and ``metadata`` are already parsed."""
+        (
+            transaction_id, user_id, transaction_type, tool_name, _, schedule_type,
+            schedule_config, status, created_at, next_execution, last_execution,
+            execution_count, max_executions, error_message, _,
+        ) = row
+
+        # Parse the stored JSON straight into the tagged config model
+        config = _SCHEDULE_CONFIG_ADAPTER.validate_json(schedule_config)
+        if config.schedule_type != schedule_type:
+            raise ValueError(
+                f"Schedule type mismatch: row says {schedule_type}, "
+                f"config says {config.schedule_type.value}"
+            )
 
         return cls(
-            id=data.get("id"),
-            user_id=data["user_id"],
-            transaction_type=data["transaction_type"],
-            tool_name=data["tool_name"],
-            parameters=json.loads(data["parameters"]),
-            schedule_config=schedule_config,
-            status=TransactionStatus(data["status"]),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            next_execution=datetime.fromisoformat(data["next_execution"]) if data["next_execution"] else None,
-            last_execution=datetime.fromisoformat(data["last_execution"]) if data["last_execution"] else None,
-            execution_count=data["execution_count"],
-            max_executions=data["max_executions"],
-            error_message=data["error_message"],
-            metadata=json.loads(data["metadata"]) if data["metadata"] else None,
+            id=transaction_id,
+            user_id=user_id,
+            transaction_type=transaction_type,
+            tool_name=tool_name,
+            parameters=parameters,
+            schedule_config=config,
+            status=TransactionStatus(status),
+            created_at=datetime.fromisoformat(created_at),
+            next_execution=datetime.fromisoformat(next_execution) if next_execution else None,
+            last_execution=datetime.fromisoformat(last_execution) if last_execution else None,
+            execution_count=execution_count,
+            max_executions=max_executions,
+            error_message=error_message,
+            metadata=metadata,
         )
 
 
@@ -284,12 +352,8 @@ class ScheduleTransactionInput(BaseModel):
     @classmethod
     def validate_tool_name(cls, v: str) -> str:
         """Validate tool name."""
-        allowed_tools = {
-            "smart_buy", "smart_sell", "jupiter_swap", "transfer_sol",
-            "pump_fun_buy", "pump_fun_sell", "aster_open_long", "aster_close_position"
-        }
-        if v not in allowed_tools:
-            raise ValueError(f"Tool '{v}' is not schedulable. Allowed tools: {', '.join(allowed_tools)}")
+        if v not in ALLOWED_TOOLS:
+            raise ValueError(f"Tool '{v}' is not schedulable. Allowed tools: {', '.join(sorted(ALLOWED_TOOLS))}")
         return v
 
 
@@ -298,6 +362,7 @@ class ListScheduledTransactionsInput(BaseModel):
     status: Optional[TransactionStatus] = Field(None, description="Filter by status")
     limit: int = Field(50, ge=1, le=200, description="Maximum number of transactions to return")
     offset: int = Field(0, ge=0, description="Offset for pagination")
+    verbose: bool = Field(True, description="Include human-readable execution times")
 
 
 class CancelScheduledTransactionInput(BaseModel):
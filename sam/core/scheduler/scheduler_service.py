@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import calendar
+import functools
+import heapq
+import itertools
 import logging
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from weakref import WeakValueDictionary
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+import aiosqlite
 
 from ..memory import MemoryManager
 from ..events import EventBus
 from ...utils.connection_pool import get_db_connection
 from .models import (
+    TRANSACTION_COLUMNS,
+    RecurrenceFrequency,
     ScheduledTransaction,
     ScheduleTransactionInput,
     TransactionStatus,
@@ -19,12 +30,136 @@ from .models import (
     OnceScheduleConfig,
     RecurringScheduleConfig,
     ConditionalScheduleConfig,
+    _EPOCH,
+    _event_timestamps,
+    _json_dumps,
 )
 from ..tools import ToolRegistry
 from .executor import ScheduledTransactionExecutor
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long the execution loop sleeps without a wakeup. Rows written by
+# another process (e.g. the scheduler daemon and an agent sharing one database) cannot
+# notify this loop, so it still rechecks the database occasionally.
+_MAX_WAIT_SECONDS = 300.0
+# Backoff when rows are still due after processing (e.g. no executor yet), so they
+# cannot spin the loop. Future rows are waited for exactly, to sub-second precision.
+_MIN_WAIT_SECONDS = 1.0
+# Backoff after an unexpected error in the execution loop.
+_ERROR_RETRY_SECONDS = 60.0
+# Most writes applied by the writer task under a single commit.
+_WRITE_BATCH_SIZE = 32
+# Most due transactions loaded per pass of the execution loop.
+_DUE_BATCH_SIZE = 500
+# Most due transactions executing at once across all shards.
+_MAX_CONCURRENT_EXECUTIONS = 16
+
+# Transaction type recorded for each schedulable tool
+_TRANSACTION_TYPES = MappingProxyType({
+    "smart_buy": "buy",
+    "smart_sell": "sell",
+    "jupiter_swap": "swap",
+    "transfer_sol": "transfer",
+    "pump_fun_buy": "buy",
+    "pump_fun_sell": "sell",
+    "aster_open_long": "futures_long",
+    "aster_close_position": "futures_close",
+})
+
+_ONE_HOUR = timedelta(hours=1)
+_ONE_DAY = timedelta(days=1)
+_ONE_WEEK = timedelta(weeks=1)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_time_of_day(text: str) -> Tuple[int, int]:
+    """Split a validated HH:MM string into (hour, minute); schedules reuse a few values."""
+    hour, minute = text.split(":")
+    return int(hour), int(minute)
+
+
+def _at_time_of_day(dt: datetime, config: RecurringScheduleConfig) -> datetime:
+    """Move dt to the schedule's time of day, if it has one."""
+    if not config.time:
+        return dt
+    hour, minute = _parse_time_of_day(config.time)
+    return dt.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+
+def _next_hourly(config: RecurringScheduleConfig, from_time: datetime) -> Optional[datetime]:
+    return from_time + _ONE_HOUR
+
+
+def _next_daily(config: RecurringScheduleConfig, from_time: datetime) -> Optional[datetime]:
+    return _at_time_of_day(from_time + _ONE_DAY, config)
+
+
+def _next_weekly(config: RecurringScheduleConfig, from_time: datetime) -> Optional[datetime]:
+    if config.days_of_week:
+        # Find next occurrence of specified days
+        for day_offset in range(1, 8):
+            next_date = from_time + timedelta(days=day_offset)
+            if next_date.weekday() + 1 in config.days_of_week:  # Convert to 1-7
+                return _at_time_of_day(next_date, config)
+    return from_time + _ONE_WEEK
+
+
+def _next_monthly(config: RecurringScheduleConfig, from_time: datetime) -> Optional[datetime]:
+    if config.day_of_month:
+        # Configured day of next month, or its last day when the month is shorter
+        next_month = _add_months(from_time.replace(day=1), 1)
+        day = min(config.day_of_month, calendar.monthrange(next_month.year, next_month.month)[1])
+        return _at_time_of_day(next_month.replace(day=day), config)
+    # Same day next month, clamped to the month's length
+    return _add_months(from_time, 1)
+
+
+# Next-occurrence step for each recurring frequency
+_RECURRENCE_STEPS: Dict[str, Callable[[RecurringScheduleConfig, datetime], Optional[datetime]]] = {
+    RecurrenceFrequency.HOURLY: _next_hourly,
+    RecurrenceFrequency.DAILY: _next_daily,
+    RecurrenceFrequency.WEEKLY: _next_weekly,
+    RecurrenceFrequency.MONTHLY: _next_monthly,
+}
+
+# Rows selected this way are read positionally by ScheduledTransaction.from_row
+_SELECT_TRANSACTIONS = f"SELECT {', '.join(TRANSACTION_COLUMNS)} FROM scheduled_transactions"
+# The due-time queries run every pass with fixed statement text, so the connection's
+# statement cache keeps them prepared; due ids are bound as one JSON array for that reason
+_DUE_TRANSACTIONS_SQL = (
+    f"{_SELECT_TRANSACTIONS} WHERE status = 'pending' AND next_execution_us <= ? "
+    f"ORDER BY next_execution_us LIMIT {_DUE_BATCH_SIZE}"
+)
+_DUE_TRANSACTIONS_BY_ID_SQL = (
+    f"{_SELECT_TRANSACTIONS} WHERE status = 'pending' AND next_execution_us <= ? "
+    "AND id IN (SELECT value FROM json_each(?)) ORDER BY next_execution_us"
+)
+
+
+def _add_months(dt: datetime, months: int) -> datetime:
+    """Shift a datetime by whole calendar months, clamping to the target month's length."""
+    month_index = dt.month - 1 + months
+    year = dt.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(dt.day, calendar.monthrange(year, month)[1])
+    return dt.replace(year=year, month=month, day=day)
+
+
+def _as_utc(dt: datetime) -> datetime:
+    """Treat naive datetimes as UTC so they compare with aware ones."""
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+def _epoch_us(dt: datetime) -> int:
+    """UTC epoch microseconds, as stored in ``next_execution_us``."""
+    return (_as_utc(dt) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _now_us() -> int:
+    """Current UTC epoch microseconds, read without building a datetime."""
+    return time.time_ns() // 1_000
+
 
 class SchedulerService:
     """Manages scheduled transaction execution."""
@@ -36,7 +171,34 @@ class SchedulerService:
         self._task: Optional[asyncio.Task] = None
         self._tool_registry: Optional[ToolRegistry] = None
         self._executor: Optional[ScheduledTransactionExecutor] = None
-        self._execution_lock = asyncio.Lock()
+        # Held by a transaction from execution until its outcome is written, so no
+        # two passes run the same transaction; entries vanish once unreferenced
+        self._tx_locks: WeakValueDictionary[int, asyncio.Lock] = WeakValueDictionary()
+        self._execution_slots = asyncio.Semaphore(_MAX_CONCURRENT_EXECUTIONS)
+        # Wakes the execution loop when the schedule changes or the service stops
+        self._wakeup = asyncio.Condition()
+        self._schedule_changed = False
+        # Dedicated connection held while running, so the loop does not go through
+        # pool checkout/validation on every query
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._conn_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._conn_stack: Optional[AsyncExitStack] = None
+        self._conn_lock = asyncio.Lock()
+        # Writes are funnelled through one task while running so concurrent callers
+        # share a commit instead of contending for SQLite's write lock
+        self._writes: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+        # (next_execution_us, id) min-heap of pending transactions while running, so
+        # idle passes never query the table. Entries may be stale (cancelled or
+        # rescheduled rows); due rows are re-checked against the table when loaded.
+        # Only touched from the event loop between awaits, so it needs no lock.
+        self._due_heap: Optional[List[Tuple[int, int]]] = None
+        self._due_heap_synced_at = 0.0
+        # In-flight listing queries, shared by concurrent callers asking for the same page
+        self._listings: Dict[tuple, asyncio.Task] = {}
+        # Bumped after every write; part of the listing key so a caller never joins a
+        # query that started before its own write landed
+        self._write_generation = 0
 
     def set_tool_registry(self, tool_registry: ToolRegistry) -> None:
         """Set the tool registry for executing transactions."""
@@ -49,7 +211,16 @@ class SchedulerService:
             logger.warning("Scheduler is already running")
             return
 
+        self._conn_stack = AsyncExitStack()
+        self._conn = await self._conn_stack.enter_async_context(
+            get_db_connection(self.memory.db_path)
+        )
+        self._conn_loop = asyncio.get_running_loop()
+        await self._load_due_heap()
         self.running = True
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        if self._executor:
+            self._executor.start_event_flusher()
         self._task = asyncio.create_task(self._execution_loop())
         logger.info("Scheduler service started")
 
@@ -59,14 +230,132 @@ class SchedulerService:
             return
 
         self.running = False
+        await self._notify_wakeup()
         if self._task:
             self._task.cancel()
             try:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        if self._executor:
+            await self._executor.stop_event_flusher()
+        await self.event_bus.drain()
+        await self._stop_writer()
+        await self._release_connection()
+        self._due_heap = None
         logger.info("Scheduler service stopped")
 
+    async def _release_connection(self) -> None:
+        """Return the dedicated connection to the pool."""
+        async with self._conn_lock:
+            stack, self._conn_stack = self._conn_stack, None
+            self._conn = None
+            self._conn_loop = None
+        if stack:
+            try:
+                await stack.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to release scheduler connection: {e}")
+
+    async def _stop_writer(self) -> None:
+        """Let the writer task apply queued writes, then shut it down."""
+        task, self._writer_task = self._writer_task, None
+        if task:
+            # Writes submitted from here on bypass the queue (see _write)
+            self._writes.put_nowait(None)
+            await task
+
+    async def _write(
+        self, sql: str, params: tuple = (), *, batchable: bool = False
+    ) -> Optional[aiosqlite.Cursor]:
+        """Execute a write statement and commit it.
+
+        While the service is running the statement is queued for the writer task and
+        committed together with whatever else is pending; otherwise it runs directly.
+        ``batchable`` marks idempotent statements whose cursor is not needed: queued
+        runs of the same statement are then bound in a single ``executemany``.
+        """
+        try:
+            writer = self._writer_task
+            # A writer left behind by a closed event loop would never resolve the future
+            if (
+                writer is None
+                or writer.done()
+                or writer.get_loop() is not asyncio.get_running_loop()
+            ):
+                async with self._connection() as conn:
+                    cursor = await conn.execute(sql, params)
+                    await conn.commit()
+                    return cursor
+
+            future = asyncio.get_running_loop().create_future()
+            self._writes.put_nowait((sql, params, future, batchable))
+            return await future
+        finally:
+            self._write_generation += 1
+
+    async def _writer_loop(self) -> None:
+        """Apply queued writes in batches, one commit per batch."""
+        while True:
+            op = await self._writes.get()
+            if op is None:
+                return
+            batch = [op]
+            stopping = False
+            while len(batch) < _WRITE_BATCH_SIZE and not self._writes.empty():
+                op = self._writes.get_nowait()
+                if op is None:
+                    stopping = True
+                    break
+                batch.append(op)
+            await self._apply_writes(batch)
+            if stopping:
+                return
+
+    async def _apply_writes(self, batch: List[tuple]) -> None:
+        """Run a batch of writes in one transaction and resolve their futures."""
+        outcomes = []
+        try:
+            async with self._connection() as conn:
+                for (sql, batchable), ops in itertools.groupby(batch, key=lambda op: (op[0], op[3])):
+                    ops = list(ops)
+                    if batchable and len(ops) > 1:
+                        try:
+                            await conn.executemany(sql, [params for _, params, _, _ in ops])
+                        except Exception:
+                            pass  # rerun one by one below to report the failing row
+                        else:
+                            outcomes.extend((future, None) for _, _, future, _ in ops)
+                            continue
+                    for _, params, future, _ in ops:
+                        try:
+                            outcomes.append((future, await conn.execute(sql, params)))
+                        except Exception as e:
+                            # A failed statement only rolls back itself; the rest still commit
+                            outcomes.append((future, e))
+                await conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to commit {len(batch)} scheduler writes: {e}")
+            outcomes = [(future, e) for _, _, future, _ in batch]
+
+        for future, outcome in outcomes:
+            if future.done():
+                continue  # caller gave up waiting
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield the dedicated connection while running, otherwise a pooled one."""
+        async with self._conn_lock:
+            if self._conn is not None and self._conn_loop is asyncio.get_running_loop():
+                yield self._conn
+                return
+        async with get_db_connection(self.memory.db_path) as conn:
+            yield conn
+
     async def schedule_transaction(
         self, 
         user_id: str, 
@@ -86,7 +375,7 @@ class SchedulerService:
             # Create scheduled transaction
             transaction = ScheduledTransaction(
                 user_id=user_id,
-                transaction_type=self._get_transaction_type(input_data.tool_name),
+                transaction_type=_TRANSACTION_TYPES.get(input_data.tool_name, "unknown"),
                 tool_name=input_data.tool_name,
                 parameters=input_data.parameters,
                 schedule_config=schedule_config,
@@ -97,14 +386,17 @@ class SchedulerService:
 
             # Store in database
             transaction_id = await self._store_transaction(transaction)
+            if next_execution:
+                self._push_due(_epoch_us(next_execution), transaction_id)
+            await self._notify_wakeup()
 
             # Emit event
-            await self.event_bus.publish("scheduler.transaction_scheduled", {
+            await self._publish("scheduler.transaction_scheduled", {
                 "transaction_id": transaction_id,
                 "user_id": user_id,
                 "tool_name": input_data.tool_name,
                 "next_execution": next_execution.isoformat() if next_execution else None,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                **_event_timestamps(),
             })
 
             logger.info(f"Scheduled transaction {transaction_id} for user {user_id}")
@@ -117,29 +409,22 @@ class SchedulerService:
     async def cancel_transaction(self, transaction_id: int, user_id: str) -> bool:
         """Cancel a scheduled transaction."""
         try:
-            async with get_db_connection(self.memory.db_path) as conn:
-                # Check if transaction exists and belongs to user
-                cursor = await conn.execute(
-                    "SELECT id FROM scheduled_transactions WHERE id = ? AND user_id = ? AND status = 'pending'",
-                    (transaction_id, user_id)
-                )
-                result = await cursor.fetchone()
-                
-                if not result:
-                    return False
-
-                # Update status to cancelled
-                await conn.execute(
-                    "UPDATE scheduled_transactions SET status = 'cancelled' WHERE id = ?",
-                    (transaction_id,)
-                )
-                await conn.commit()
+            # Only pending transactions owned by the user can be cancelled
+            cursor = await self._write(
+                "UPDATE scheduled_transactions SET status = 'cancelled' "
+                "WHERE id = ? AND user_id = ? AND status = 'pending'",
+                (transaction_id, user_id)
+            )
+            if cursor.rowcount == 0:
+                return False
+            # The earliest due time may have moved later; let the loop re-check it
+            await self._notify_wakeup()
 
             # Emit event
-            await self.event_bus.publish("scheduler.transaction_cancelled", {
+            await self._publish("scheduler.transaction_cancelled", {
                 "transaction_id": transaction_id,
                 "user_id": user_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                **_event_timestamps(),
             })
 
             logger.info(f"Cancelled transaction {transaction_id} for user {user_id}")
@@ -156,10 +441,31 @@ class SchedulerService:
         limit: int = 50,
         offset: int = 0
     ) -> List[ScheduledTransaction]:
-        """List scheduled transactions for a user."""
+        """List scheduled transactions for a user.
+
+        Concurrent calls for the same page share one query instead of each scanning,
+        as long as no write has completed in between.
+        """
+        key = (user_id, status, limit, offset, self._write_generation)
+        query = self._listings.get(key)
+        if query is None:
+            query = asyncio.create_task(self._query_user_transactions(user_id, status, limit, offset))
+            self._listings[key] = query
+            query.add_done_callback(lambda _: self._listings.pop(key, None))
+        # Shielded so one caller giving up does not cancel the query for the others
+        return list(await asyncio.shield(query))
+
+    async def _query_user_transactions(
+        self,
+        user_id: str,
+        status: Optional[TransactionStatus],
+        limit: int,
+        offset: int,
+    ) -> List[ScheduledTransaction]:
+        """Load one page of a user's scheduled transactions."""
         try:
-            async with get_db_connection(self.memory.db_path) as conn:
-                query = "SELECT * FROM scheduled_transactions WHERE user_id = ?"
+            async with self._connection() as conn:
+                query = f"{_SELECT_TRANSACTIONS} WHERE user_id = ?"
                 params = [user_id]
 
                 if status:
@@ -172,108 +478,281 @@ class SchedulerService:
                 cursor = await conn.execute(query, params)
                 rows = await cursor.fetchall()
 
-                transactions = []
-                for row in rows:
-                    # Convert row to dict
-                    row_dict = dict(zip([col[0] for col in cursor.description], row))
-                    transaction = ScheduledTransaction.from_dict(row_dict)
-                    transactions.append(transaction)
-
-                return transactions
+                return ScheduledTransaction.from_rows(rows)
 
         except Exception as e:
             logger.error(f"Failed to list transactions for user {user_id}: {e}")
             return []
 
     async def _execution_loop(self) -> None:
-        """Main execution loop - runs every minute."""
+        """Main execution loop - sleeps until the next transaction is due or a wakeup."""
         logger.info("Starting scheduler execution loop")
         
         while self.running:
             try:
-                await self._process_due_transactions()
-                await asyncio.sleep(60)  # Check every minute
+                # Rows written by other processes only reach the heap on a resync
+                if time.monotonic() - self._due_heap_synced_at >= _MAX_WAIT_SECONDS:
+                    await self._load_due_heap()
+                if await self._process_due_transactions() >= _DUE_BATCH_SIZE:
+                    # A full batch means more rows are likely overdue; keep draining
+                    logger.warning(f"Scheduler backlog: processed a full batch of {_DUE_BATCH_SIZE}")
+                    continue
+                timeout = await self._seconds_until_next_due()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in scheduler execution loop: {e}")
-                await asyncio.sleep(60)  # Continue after error
+                timeout = _ERROR_RETRY_SECONDS  # Continue after error
 
-        logger.info("Scheduler execution loop stopped")
+            try:
+                await self._wait_for_wakeup(timeout)
+            except asyncio.CancelledError:
+                break
 
-    async def _process_due_transactions(self) -> None:
-        """Process transactions that are due for execution."""
-        if not self._executor:
-            logger.warning("No executor available, skipping transaction processing")
-            return
+        if self.running:
+            # Cancelled by its event loop shutting down rather than by stop(): the
+            # connection and writer belong to that loop, so release them with it
+            self.running = False
+            self._writer_task = None
+            self._due_heap = None
+            await self._release_connection()
+            # Locks and queues bind to the loop that first waits on them; start afresh
+            # in case the service is started again on another loop
+            self._execution_slots = asyncio.Semaphore(_MAX_CONCURRENT_EXECUTIONS)
+            self._wakeup = asyncio.Condition()
+            self._conn_lock = asyncio.Lock()
+            self._writes = asyncio.Queue()
+
+        logger.info("Scheduler execution loop stopped")
 
-        async with self._execution_lock:
+    async def _wait_for_wakeup(self, timeout: float) -> None:
+        """Block until the schedule changes, the service stops, or the timeout elapses."""
+        async with self._wakeup:
             try:
-                # Get due transactions
-                due_transactions = await self._get_due_transactions()
-                
-                for transaction in due_transactions:
-                    try:
-                        # Pre-flight check
-                        if not await self._executor.can_execute_transaction(transaction):
-                            logger.warning(f"Skipping transaction {transaction.id} - pre-flight check failed")
-                            await self._mark_transaction_failed(transaction.id, "Pre-flight check failed")
-                            continue
+                await asyncio.wait_for(
+                    self._wakeup.wait_for(lambda: self._schedule_changed or not self.running),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._schedule_changed = False
 
-                        # Execute the transaction
-                        result = await self._executor.execute_transaction(transaction)
-                        
-                        # Check if execution was successful
-                        if isinstance(result, dict) and result.get("error"):
-                            await self._mark_transaction_failed(transaction.id, result["error"])
-                        else:
-                            await self._mark_transaction_executed(transaction, result)
+    async def _publish(self, event: str, payload: Dict[str, Any]) -> None:
+        """Publish a lifecycle event.
 
-                    except Exception as e:
-                        logger.error(f"Failed to execute transaction {transaction.id}: {e}")
-                        await self._mark_transaction_failed(transaction.id, str(e))
+        While running, handlers run in the background and ``stop`` waits for them;
+        otherwise nothing would drain the bus, so the event is published inline.
+        """
+        if self.running:
+            self.event_bus.publish_nowait(event, payload)
+        else:
+            await self.event_bus.publish(event, payload)
 
-            except Exception as e:
-                logger.error(f"Error processing due transactions: {e}")
+    async def _notify_wakeup(self) -> None:
+        """Wake the execution loop so it re-evaluates the next due time."""
+        async with self._wakeup:
+            self._schedule_changed = True
+            self._wakeup.notify_all()
 
-    async def _get_due_transactions(self) -> List[ScheduledTransaction]:
-        """Get transactions that are due for execution."""
-        now = datetime.now(timezone.utc)
-        
+    async def _load_due_heap(self) -> None:
+        """Rebuild the due-time heap from the pending rows in the database."""
         try:
-            async with get_db_connection(self.memory.db_path) as conn:
+            async with self._connection() as conn:
                 cursor = await conn.execute(
                     """
-                    SELECT * FROM scheduled_transactions 
+                    SELECT next_execution_us, id FROM scheduled_transactions
+                    WHERE status = 'pending'
+                    AND next_execution_us IS NOT NULL
+                    """
+                )
+                heap = [tuple(row) for row in await cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Failed to load pending transactions: {e}")
+            return
+        heapq.heapify(heap)
+        self._due_heap = heap
+        self._due_heap_synced_at = time.monotonic()
+
+    def _push_due(self, next_execution_us: int, transaction_id: int) -> None:
+        """Track a pending transaction's due time while the heap is loaded."""
+        if self._due_heap is not None:
+            heapq.heappush(self._due_heap, (next_execution_us, transaction_id))
+
+    def _requeue(self, transaction: ScheduledTransaction) -> None:
+        """Put a popped, still-pending transaction back on the due heap for the next pass."""
+        if transaction.next_execution is not None:
+            self._push_due(_epoch_us(transaction.next_execution), transaction.id)
+
+    async def _seconds_until_next_due(self) -> float:
+        """Seconds until the earliest pending transaction is due, capped at the max wait."""
+        if self._due_heap is not None:
+            next_due = self._due_heap[0][0] if self._due_heap else None
+        else:
+            async with self._connection() as conn:
+                cursor = await conn.execute(
+                    """
+                    SELECT MIN(next_execution_us) FROM scheduled_transactions 
                     WHERE status = 'pending' 
-                    AND next_execution IS NOT NULL 
-                    AND next_execution <= ?
-                    ORDER BY next_execution ASC
-                    """,
-                    (now.isoformat(),)
+                    AND next_execution_us IS NOT NULL
+                    """
                 )
-                rows = await cursor.fetchall()
+                row = await cursor.fetchone()
+            next_due = row[0] if row else None
 
-                transactions = []
-                for row in rows:
-                    row_dict = dict(zip([col[0] for col in cursor.description], row))
-                    transaction = ScheduledTransaction.from_dict(row_dict)
-                    transactions.append(transaction)
+        if next_due is None:
+            return _MAX_WAIT_SECONDS
 
-                return transactions
+        delay = (next_due - _now_us()) / 1_000_000
+        if delay <= 0:
+            return _MIN_WAIT_SECONDS
+        return min(delay, _MAX_WAIT_SECONDS)
+
+    async def _process_due_transactions(self) -> int:
+        """Process one batch of due transactions and return how many were loaded."""
+        if not self._executor:
+            logger.warning("No executor available, skipping transaction processing")
+            return 0
+
+        due_transactions: List[ScheduledTransaction] = []
+        # One clock read per pass: it selects the due rows and stamps their outcomes
+        now_us = _now_us()
+        heap = self._due_heap
+        if heap is not None and (not heap or heap[0][0] > now_us):
+            # Idle pass: the heap says nothing is due, so skip the query entirely
+            return 0
+        now = _EPOCH + timedelta(microseconds=now_us)
+        try:
+            # Get due transactions
+            due_transactions = await self._get_due_transactions(now)
+
+            # Transactions of the same user and tool may touch the same wallet or
+            # position, so they run in order; different shards run concurrently
+            shards: Dict[tuple, List[ScheduledTransaction]] = {}
+            for transaction in due_transactions:
+                shards.setdefault((transaction.user_id, transaction.tool_name), []).append(transaction)
+
+            await asyncio.gather(*(self._process_shard(shard, now) for shard in shards.values()))
+
+        except Exception as e:
+            logger.error(f"Error processing due transactions: {e}")
+        return len(due_transactions)
+
+    async def _process_shard(self, transactions: List[ScheduledTransaction], now: datetime) -> None:
+        """Execute one shard's due transactions sequentially.
+
+        Each execution holds one of the shared execution slots, bounding how many
+        transactions run at once across shards, and its transaction's lock, which
+        skips transactions another pass already has in flight. Outcomes are recorded
+        in the background so the next transaction does not wait for the previous
+        commit; queued outcome writes from all shards are bound into shared
+        ``executemany`` batches, and all of them land before the shard returns.
+        """
+        outcomes = []
+        for transaction in transactions:
+            lock = self._tx_locks.setdefault(transaction.id, asyncio.Lock())
+            if lock.locked():
+                # Another pass is still executing or recording this transaction; keep
+                # it in the heap in case that pass leaves it pending
+                self._requeue(transaction)
+                continue
+            await lock.acquire()
+            try:
+                async with self._execution_slots:
+                    outcome = await self._process_transaction(transaction, now)
+            except Exception as e:
+                lock.release()
+                logger.error(f"Failed to process transaction {transaction.id}: {e}")
+                self._requeue(transaction)
+                continue
+            except BaseException:
+                lock.release()
+                self._requeue(transaction)
+                raise
+            outcomes.append(asyncio.create_task(self._record_outcome(outcome, lock)))
+        # Unlike gather, wait leaves the writes running if the loop is cancelled on stop,
+        # so executed transactions are still recorded before the writer drains
+        if outcomes:
+            await asyncio.wait(outcomes)
+
+    @staticmethod
+    async def _record_outcome(outcome: Awaitable[None], lock: asyncio.Lock) -> None:
+        """Write a transaction's outcome, then release its lock."""
+        try:
+            await outcome
+        finally:
+            lock.release()
+
+    async def _process_transaction(
+        self, transaction: ScheduledTransaction, now: Optional[datetime] = None
+    ) -> Awaitable[None]:
+        """Run one due transaction and return the write that records its outcome."""
+        try:
+            # Pre-flight check
+            if not await self._executor.can_execute_transaction(transaction):
+                logger.warning(f"Skipping transaction {transaction.id} - pre-flight check failed")
+                return self._mark_transaction_failed(transaction.id, "Pre-flight check failed")
+
+            # Execute the transaction
+            result = await self._executor.execute_transaction(
+                transaction, validated=True, batch_events=True
+            )
+
+            # Check if execution was successful
+            if isinstance(result, dict) and result.get("error"):
+                return self._mark_transaction_failed(transaction.id, result["error"])
+            return self._mark_transaction_executed(transaction, result, now)
+
+        except Exception as e:
+            logger.error(f"Failed to execute transaction {transaction.id}: {e}")
+            return self._mark_transaction_failed(transaction.id, str(e))
+
+    async def _get_due_transactions(self, now: Optional[datetime] = None) -> List[ScheduledTransaction]:
+        """Get transactions that are due for execution."""
+        now_us = _epoch_us(now or datetime.now(timezone.utc))
+        query = _DUE_TRANSACTIONS_SQL
+        params: tuple = (now_us,)
+
+        popped: List[Tuple[int, int]] = []
+        if self._due_heap is not None:
+            # Only load the rows the heap says are due
+            heap = self._due_heap
+            due_ids = set()
+            while heap and heap[0][0] <= now_us and len(due_ids) < _DUE_BATCH_SIZE:
+                entry = heapq.heappop(heap)
+                popped.append(entry)
+                due_ids.add(entry[1])
+            if not due_ids:
+                return []
+            query = _DUE_TRANSACTIONS_BY_ID_SQL
+            params += (_json_dumps(sorted(due_ids)),)
+
+        try:
+            async with self._connection() as conn:
+                cursor = await conn.execute(query, params)
+                rows = await cursor.fetchall()
+
+                return ScheduledTransaction.from_rows(rows)
 
         except Exception as e:
             logger.error(f"Failed to get due transactions: {e}")
+            # Nothing was loaded, so keep the popped entries for the next pass
+            for next_execution_us, transaction_id in popped:
+                self._push_due(next_execution_us, transaction_id)
             return []
 
 
     async def _mark_transaction_executed(
         self, 
         transaction: ScheduledTransaction, 
-        result: Dict[str, Any]
+        result: Dict[str, Any],
+        now: Optional[datetime] = None
     ) -> None:
-        """Mark transaction as executed and schedule next execution if needed."""
-        now = datetime.now(timezone.utc)
+        """Mark transaction as executed and schedule next execution if needed.
+
+        ``now`` is the processing pass's clock reading; recurrences are anchored to
+        it so a slow execution does not push the next run later.
+        """
+        now = now or datetime.now(timezone.utc)
         
         # Calculate next execution for recurring transactions
         next_execution = None
@@ -292,26 +771,29 @@ class SchedulerService:
             status = TransactionStatus.EXECUTED
 
         try:
-            async with get_db_connection(self.memory.db_path) as conn:
-                await conn.execute(
-                    """
-                    UPDATE scheduled_transactions 
-                    SET status = ?, 
-                        last_execution = ?, 
-                        next_execution = ?, 
-                        execution_count = ?,
-                        error_message = NULL
-                    WHERE id = ?
-                    """,
-                    (
-                        status.value,
-                        now.isoformat(),
-                        next_execution.isoformat() if next_execution else None,
-                        new_execution_count,
-                        transaction.id,
-                    )
-                )
-                await conn.commit()
+            await self._write(
+                """
+                UPDATE scheduled_transactions 
+                SET status = ?, 
+                    last_execution = ?, 
+                    next_execution = ?, 
+                    next_execution_us = ?,
+                    execution_count = ?,
+                    error_message = NULL
+                WHERE id = ?
+                """,
+                (
+                    status.value,
+                    now.isoformat(),
+                    next_execution.isoformat() if next_execution else None,
+                    _epoch_us(next_execution) if next_execution else None,
+                    new_execution_count,
+                    transaction.id,
+                ),
+                batchable=True,
+            )
+            if status == TransactionStatus.PENDING:
+                self._push_due(_epoch_us(next_execution), transaction.id)
 
         except Exception as e:
             logger.error(f"Failed to update transaction {transaction.id}: {e}")
@@ -319,17 +801,16 @@ class SchedulerService:
     async def _mark_transaction_failed(self, transaction_id: int, error_message: str) -> None:
         """Mark transaction as failed."""
         try:
-            async with get_db_connection(self.memory.db_path) as conn:
-                await conn.execute(
-                    """
-                    UPDATE scheduled_transactions 
-                    SET status = 'failed', 
-                        error_message = ?
-                    WHERE id = ?
-                    """,
-                    (error_message, transaction_id)
-                )
-                await conn.commit()
+            await self._write(
+                """
+                UPDATE scheduled_transactions 
+                SET status = 'failed', 
+                    error_message = ?
+                WHERE id = ?
+                """,
+                (error_message, transaction_id),
+                batchable=True,
+            )
 
         except Exception as e:
             logger.error(f"Failed to mark transaction {transaction_id} as failed: {e}")
@@ -337,34 +818,33 @@ class SchedulerService:
     async def _store_transaction(self, transaction: ScheduledTransaction) -> int:
         """Store transaction in database and return ID."""
         try:
-            async with get_db_connection(self.memory.db_path) as conn:
-                data = transaction.to_dict()
-                
-                cursor = await conn.execute(
-                    """
-                    INSERT INTO scheduled_transactions 
-                    (user_id, transaction_type, tool_name, parameters, schedule_type, 
-                     schedule_config, status, created_at, next_execution, execution_count, 
-                     max_executions, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        data["user_id"],
-                        data["transaction_type"],
-                        data["tool_name"],
-                        data["parameters"],
-                        data["schedule_type"],
-                        data["schedule_config"],
-                        data["status"],
-                        data["created_at"],
-                        data["next_execution"],
-                        data["execution_count"],
-                        data["max_executions"],
-                        data["metadata"],
-                    )
+            data = transaction.to_dict()
+
+            cursor = await self._write(
+                """
+                INSERT INTO scheduled_transactions 
+                (user_id, transaction_type, tool_name, parameters, schedule_type, 
+                 schedule_config, status, created_at, next_execution, next_execution_us,
+                 execution_count, max_executions, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    data["user_id"],
+                    data["transaction_type"],
+                    data["tool_name"],
+                    data["parameters"],
+                    data["schedule_type"],
+                    data["schedule_config"],
+                    data["status"],
+                    data["created_at"],
+                    data["next_execution"],
+                    _epoch_us(transaction.next_execution) if transaction.next_execution else None,
+                    data["execution_count"],
+                    data["max_executions"],
+                    data["metadata"],
                 )
-                await conn.commit()
-                return cursor.lastrowid
+            )
+            return cursor.lastrowid
 
         except Exception as e:
             logger.error(f"Failed to store transaction: {e}")
@@ -406,57 +886,36 @@ class SchedulerService:
         from_time: datetime
     ) -> Optional[datetime]:
         """Calculate next execution time for recurring schedule."""
-        if config.frequency == "hourly":
-            return from_time + timedelta(hours=1)
-        elif config.frequency == "daily":
-            next_day = from_time + timedelta(days=1)
-            if config.time:
-                hour, minute = map(int, config.time.split(":"))
-                return next_day.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            return next_day
-        elif config.frequency == "weekly":
-            if config.days_of_week:
-                # Find next occurrence of specified days
-                for day_offset in range(1, 8):
-                    next_date = from_time + timedelta(days=day_offset)
-                    if next_date.weekday() + 1 in config.days_of_week:  # Convert to 1-7
-                        if config.time:
-                            hour, minute = map(int, config.time.split(":"))
-                            return next_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                        return next_date
-            return from_time + timedelta(weeks=1)
-        elif config.frequency == "monthly":
-            if config.day_of_month:
-                # Find next occurrence of specified day of month
-                next_month = from_time.replace(day=1) + timedelta(days=32)
-                next_month = next_month.replace(day=1)  # First day of next month
-                try:
-                    next_date = next_month.replace(day=config.day_of_month)
-                    if config.time:
-                        hour, minute = map(int, config.time.split(":"))
-                        return next_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    return next_date
-                except ValueError:
-                    # Day doesn't exist in that month, use last day
-                    last_day = (next_month + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-                    if config.time:
-                        hour, minute = map(int, config.time.split(":"))
-                        return last_day.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    return last_day
-            return from_time + timedelta(days=30)  # Approximate month
-        
-        return None
-
-    def _get_transaction_type(self, tool_name: str) -> str:
-        """Get transaction type from tool name."""
-        type_mapping = {
-            "smart_buy": "buy",
-            "smart_sell": "sell", 
-            "jupiter_swap": "swap",
-            "transfer_sol": "transfer",
-            "pump_fun_buy": "buy",
-            "pump_fun_sell": "sell",
-            "aster_open_long": "futures_long",
-            "aster_close_position": "futures_close",
-        }
-        return type_mapping.get(tool_name, "unknown")
+        return next(self._iter_recurring_executions(config, from_time), None)
+
+    def _iter_recurring_executions(
+        self,
+        config: RecurringScheduleConfig,
+        from_time: datetime
+    ) -> Iterator[datetime]:
+        """Expand a recurring schedule into its successive executions after from_time.
+
+        Occurrences before start_date are skipped and expansion stops at end_date.
+        """
+        start_date = _as_utc(config.start_date) if config.start_date else None
+        end_date = _as_utc(config.end_date) if config.end_date else None
+
+        current = from_time
+        while True:
+            current = self._next_recurring_step(config, current)
+            if current is None:
+                return
+            if end_date and _as_utc(current) > end_date:
+                return
+            if start_date and _as_utc(current) < start_date:
+                continue
+            yield current
+
+    def _next_recurring_step(
+        self, 
+        config: RecurringScheduleConfig, 
+        from_time: datetime
+    ) -> Optional[datetime]:
+        """Compute the single occurrence that follows from_time."""
+        step = _RECURRENCE_STEPS.get(config.frequency)
+        return step(config, from_time) if step else None
@@ -3,142 +3,254 @@
 from __future__ import annotations
 
 import logging
+from contextvars import ContextVar, Token
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional
 import re
 
 from ..tools import Tool, ToolSpec
-from ...utils.time_helpers import calculate_execution_time, format_execution_time, get_time_until_execution
+from ...utils.time_helpers import (
+    _UNIT_DELTAS,
+    _to_24_hour,
+    calculate_execution_time,
+    format_execution_time,
+    get_time_until_execution,
+)
 from .models import (
+    ScheduledTransaction,
     ScheduleTransactionInput,
     ListScheduledTransactionsInput,
     CancelScheduledTransactionInput,
-    TransactionStatus,
-    ScheduleType,
-    OnceScheduleConfig,
-    RecurringScheduleConfig,
 )
 from .scheduler_service import SchedulerService
 
 logger = logging.getLogger(__name__)
 
+# User the scheduler tools act for; set per agent run so concurrent runs don't share it
+_USER_ID: ContextVar[str] = ContextVar("scheduler_user_id", default="default")
 
-def parse_relative_time(time_str: str) -> Optional[datetime]:
-    """Parse relative time expressions like 'in 3 minutes', 'in 1 hour', etc."""
-    if not time_str:
-        return None
-    
-    time_str = time_str.lower().strip()
-    
-    # Pattern for "in X minutes/hours/days"
-    relative_pattern = r'in\s+(\d+)\s+(minute|hour|day|week)s?'
-    match = re.search(relative_pattern, time_str)
-    
-    if match:
-        amount = int(match.group(1))
-        unit = match.group(2)
-        
-        now = datetime.now(timezone.utc)
-        
-        if unit == 'minute':
-            return now + timedelta(minutes=amount)
-        elif unit == 'hour':
-            return now + timedelta(hours=amount)
-        elif unit == 'day':
-            return now + timedelta(days=amount)
-        elif unit == 'week':
-            return now + timedelta(weeks=amount)
-    
-    return None
+# "in X minutes/hours/days/weeks" or "at HH:MM AM/PM" in one scan, for
+# validate_and_fix_schedule_config
+_TIME_RE = re.compile(
+    r'in\s+(?P<amount>\d+)\s+(?P<unit>minute|hour|day|week)s?'
+    r'|at\s+(?P<hour>\d{1,2}):(?P<minute>\d{2})\s*(?P<ampm>am|pm)?'
+)
 
 
-def parse_absolute_time(time_str: str) -> Optional[datetime]:
-    """Parse absolute time expressions like 'at 9:00 AM', 'tomorrow at 10:00', etc."""
-    if not time_str:
-        return None
-    
+# Tool input schemas, shared by every create_scheduler_tools call
+_SCHEDULE_TRANSACTION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "tool_name": {
+            "type": "string",
+            "description": "Name of the tool to execute",
+            "enum": [
+                "smart_buy", "smart_sell", "jupiter_swap", "transfer_sol",
+                "pump_fun_buy", "pump_fun_sell", "aster_open_long", "aster_close_position"
+            ]
+        },
+        "parameters": {
+            "type": "object",
+            "description": "Parameters for the tool execution"
+        },
+        "schedule_type": {
+            "type": "string",
+            "description": "Type of schedule",
+            "enum": ["once", "recurring", "conditional"]
+        },
+        "schedule_config": {
+            "type": "object",
+            "description": "Schedule configuration (varies by schedule_type)"
+        },
+        "max_executions": {
+            "type": "integer",
+            "description": "Maximum number of executions (optional)",
+            "minimum": 1
+        },
+        "notes": {
+            "type": "string",
+            "description": "User notes about the transaction (optional)"
+        }
+    },
+    "required": ["tool_name", "parameters", "schedule_type", "schedule_config"]
+}
+
+_LIST_TRANSACTIONS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "status": {
+            "type": "string",
+            "description": "Filter by status",
+            "enum": ["pending", "executed", "failed", "cancelled", "expired"]
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of transactions to return",
+            "minimum": 1,
+            "maximum": 200,
+            "default": 50
+        },
+        "offset": {
+            "type": "integer",
+            "description": "Offset for pagination",
+            "minimum": 0,
+            "default": 0
+        },
+        "verbose": {
+            "type": "boolean",
+            "description": "Include human-readable execution times",
+            "default": True
+        }
+    }
+}
+
+# Read-only: shared by every list call made without arguments
+_DEFAULT_LIST_INPUT = ListScheduledTransactionsInput()
+
+_CANCEL_TRANSACTION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "transaction_id": {
+            "type": "integer",
+            "description": "ID of the transaction to cancel"
+        }
+    },
+    "required": ["transaction_id"]
+}
+
+
+def _parse_time_expression(time_str: str) -> Optional[datetime]:
+    """Parse a relative ('in 3 minutes') or absolute ('at 9:00 AM') time in one regex scan.
+
+    When both forms appear, the one earlier in the string wins.
+    """
     time_str = time_str.lower().strip()
+    # Both forms contain a literal "in"/"at"; ISO timestamps usually contain neither
+    if 'in' not in time_str and 'at' not in time_str:
+        return None
+    match = _TIME_RE.search(time_str)
+    if not match:
+        return None
+
     now = datetime.now(timezone.utc)
-    
-    # Pattern for "at HH:MM AM/PM"
-    time_pattern = r'at\s+(\d{1,2}):(\d{2})\s*(am|pm)?'
-    match = re.search(time_pattern, time_str)
-    
-    if match:
-        hour = int(match.group(1))
-        minute = int(match.group(2))
-        ampm = match.group(3)
-        
-        # Convert to 24-hour format
-        if ampm == 'pm' and hour != 12:
-            hour += 12
-        elif ampm == 'am' and hour == 12:
-            hour = 0
-        
-        # Check if it's for today or tomorrow
-        target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        
-        if target_time <= now:
-            # If time has passed today, schedule for tomorrow
-            target_time += timedelta(days=1)
-        
-        return target_time
-    
-    return None
+    if match['unit']:
+        return now + int(match['amount']) * _UNIT_DELTAS[match['unit']]
+
+    hour = int(match['hour'])
+    minute = int(match['minute'])
+    ampm = match['ampm']
+
+    hour = _to_24_hour(hour, ampm)
+
+    # If time has passed today, schedule for tomorrow
+    target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target_time <= now:
+        target_time += timedelta(days=1)
+    return target_time
 
 
 def validate_and_fix_schedule_config(schedule_type: str, schedule_config: Dict[str, Any]) -> Dict[str, Any]:
     """Validate and fix schedule configuration, especially for time calculations."""
     if schedule_type == "once":
-        execute_at = schedule_config.get("execute_at")
-        
-        if execute_at:
+        _fix_execute_at(schedule_config)
+    return schedule_config
+
+
+def _fix_execute_at(schedule_config: Dict[str, Any]) -> Optional[datetime]:
+    """Resolve a once-schedule's ``execute_at`` in place and return it as a datetime.
+
+    Returns None when the config has no ``execute_at``.
+    """
+    execute_at = schedule_config.get("execute_at")
+    if not execute_at:
+        return None
+
+    now = datetime.now(timezone.utc)
+    try:
+        if isinstance(execute_at, str):
+            # ISO timestamps are the usual input and can never match the
+            # natural-language forms, so try them first
             try:
-                if isinstance(execute_at, str):
-                    # Use the new time helper to calculate execution time
-                    calculated_time = calculate_execution_time(execute_at)
-                    if calculated_time:
-                        schedule_config["execute_at"] = calculated_time
-                        return schedule_config
-                    
-                    # Fallback to old parsing methods
-                    relative_time = parse_relative_time(execute_at)
-                    if relative_time:
-                        schedule_config["execute_at"] = relative_time.isoformat()
-                        return schedule_config
-                    
-                    absolute_time = parse_absolute_time(execute_at)
-                    if absolute_time:
-                        schedule_config["execute_at"] = absolute_time.isoformat()
-                        return schedule_config
-                    
-                    # Try to parse as ISO format
-                    parsed_time = datetime.fromisoformat(execute_at.replace('Z', '+00:00'))
-                    
-                    # If the time is in the past, add a small buffer
-                    now = datetime.now(timezone.utc)
-                    if parsed_time <= now:
-                        # Add 1 minute to ensure it's in the future
-                        parsed_time = now + timedelta(minutes=1)
-                        schedule_config["execute_at"] = parsed_time.isoformat()
-                        logger.warning(f"Adjusted past execution time to {parsed_time.isoformat()}")
-                    
-                elif isinstance(execute_at, datetime):
-                    # If it's already a datetime object, ensure it's in the future
-                    now = datetime.now(timezone.utc)
-                    if execute_at <= now:
-                        execute_at = now + timedelta(minutes=1)
-                        schedule_config["execute_at"] = execute_at.isoformat()
-                        logger.warning(f"Adjusted past execution time to {execute_at.isoformat()}")
+                parsed_time = datetime.fromisoformat(execute_at)
+            except ValueError:
+                # Use the new time helper to calculate execution time
+                calculated_time = calculate_execution_time(execute_at)
+                if calculated_time:
+                    schedule_config["execute_at"] = calculated_time
+                    return datetime.fromisoformat(calculated_time)
                 
-            except Exception as e:
-                logger.error(f"Failed to parse execution time: {e}")
-                # Default to 1 minute from now
-                default_time = datetime.now(timezone.utc) + timedelta(minutes=1)
-                schedule_config["execute_at"] = default_time.isoformat()
-                logger.warning(f"Using default execution time: {default_time.isoformat()}")
+                # Fallback to the relative/absolute forms
+                parsed_time = _parse_time_expression(execute_at)
+                if parsed_time:
+                    schedule_config["execute_at"] = parsed_time.isoformat()
+                    return parsed_time
+                raise
+            
+            # Naive timestamps are taken as UTC rather than failing the comparison below
+            if parsed_time.tzinfo is None:
+                parsed_time = parsed_time.replace(tzinfo=timezone.utc)
+                schedule_config["execute_at"] = parsed_time.isoformat()
+            
+            # If the time is in the past, add a small buffer
+            if parsed_time <= now:
+                # Add 1 minute to ensure it's in the future
+                parsed_time = now + timedelta(minutes=1)
+                schedule_config["execute_at"] = parsed_time.isoformat()
+                logger.warning(f"Adjusted past execution time to {parsed_time.isoformat()}")
+            return parsed_time
+            
+        elif isinstance(execute_at, datetime):
+            # If it's already a datetime object, ensure it's in the future
+            if execute_at.tzinfo is None:
+                execute_at = execute_at.replace(tzinfo=timezone.utc)
+            if execute_at <= now:
+                execute_at = now + timedelta(minutes=1)
+                schedule_config["execute_at"] = execute_at.isoformat()
+                logger.warning(f"Adjusted past execution time to {execute_at.isoformat()}")
+            return execute_at
+        
+    except (ValueError, TypeError, OverflowError) as e:
+        logger.error(f"Failed to parse execution time: {e}")
+        # Default to 1 minute from now
+        default_time = now + timedelta(minutes=1)
+        schedule_config["execute_at"] = default_time.isoformat()
+        logger.warning(f"Using default execution time: {default_time.isoformat()}")
+        return default_time
     
-    return schedule_config
+    return None
+
+
+def _format_transaction(tx: ScheduledTransaction, verbose: bool, now: datetime) -> Dict[str, Any]:
+    """Build one row of the list_scheduled_transactions response."""
+    # Format execution times straight from the datetimes, without ISO round trips
+    next_execution = tx.next_execution
+    last_execution = tx.last_execution
+    next_execution_formatted = None
+    time_until_execution = None
+    if next_execution and verbose:
+        next_execution_formatted = format_execution_time(next_execution)
+        time_until_execution = get_time_until_execution(next_execution, now)
+
+    last_execution_formatted = None
+    if last_execution and verbose:
+        last_execution_formatted = format_execution_time(last_execution)
+
+    return {
+        "id": tx.id,
+        "tool_name": tx.tool_name,
+        "transaction_type": tx.transaction_type,
+        "status": tx.status.value,
+        "created_at": tx.created_at.isoformat(),
+        "next_execution": next_execution.isoformat() if next_execution else None,
+        "next_execution_formatted": next_execution_formatted,
+        "time_until_execution": time_until_execution,
+        "last_execution": last_execution.isoformat() if last_execution else None,
+        "last_execution_formatted": last_execution_formatted,
+        "execution_count": tx.execution_count,
+        "max_executions": tx.max_executions,
+        "error_message": tx.error_message,
+        "notes": tx.metadata.get("notes") if tx.metadata else None,
+    }
 
 
 def create_scheduler_tools(scheduler_service: SchedulerService) -> List[Tool]:
@@ -148,37 +260,29 @@ def create_scheduler_tools(scheduler_service: SchedulerService) -> List[Tool]:
         """Schedule a transaction for future execution."""
         try:
             # Get user_id from context (this will be set by the agent)
-            user_id = getattr(scheduler_service, "_current_user_id", "default")
+            user_id = _USER_ID.get()
             
             # Validate and fix schedule configuration
             schedule_type = args.get("schedule_type", "once")
             schedule_config = args.get("schedule_config", {})
             
-            # Apply time validation and fixes
-            fixed_schedule_config = validate_and_fix_schedule_config(schedule_type, schedule_config)
-            args["schedule_config"] = fixed_schedule_config
+            # Apply time validation and fixes, keeping the resolved time for the reply
+            execution_time = _fix_execute_at(schedule_config) if schedule_type == "once" else None
+            args["schedule_config"] = schedule_config
             
             # Parse input
-            input_data = ScheduleTransactionInput(**args)
+            input_data = ScheduleTransactionInput.model_validate(args)
             
             # Schedule the transaction
             transaction_id = await scheduler_service.schedule_transaction(user_id, input_data)
             
             # Get execution time for user feedback
-            execution_time = None
-            time_until_execution = None
-            if schedule_type == "once" and "execute_at" in fixed_schedule_config:
-                try:
-                    execution_time_str = fixed_schedule_config["execute_at"]
-                    execution_time = datetime.fromisoformat(execution_time_str.replace('Z', '+00:00'))
-                    time_until_execution = get_time_until_execution(execution_time_str)
-                except:
-                    pass
+            time_until_execution = get_time_until_execution(execution_time) if execution_time else None
             
             # Format response message
             message = f"✅ Transaction scheduled successfully with ID: {transaction_id}"
             if execution_time:
-                formatted_time = format_execution_time(execution_time.isoformat())
+                formatted_time = format_execution_time(execution_time)
                 message += f"\n⏰ Execution time: {formatted_time}"
                 if time_until_execution:
                     message += f"\n⏳ Time until execution: {time_until_execution}"
@@ -213,10 +317,12 @@ def create_scheduler_tools(scheduler_service: SchedulerService) -> List[Tool]:
         """List scheduled transactions for the user."""
         try:
             # Get user_id from context
-            user_id = getattr(scheduler_service, "_current_user_id", "default")
+            user_id = _USER_ID.get()
             
-            # Parse input
-            input_data = ListScheduledTransactionsInput(**args)
+            # Parse input; the common no-argument call reuses the prebuilt defaults
+            input_data = (
+                ListScheduledTransactionsInput.model_validate(args) if args else _DEFAULT_LIST_INPUT
+            )
             
             # Get transactions
             transactions = await scheduler_service.list_user_transactions(
@@ -227,35 +333,9 @@ def create_scheduler_tools(scheduler_service: SchedulerService) -> List[Tool]:
             )
             
             # Format results
-            formatted_transactions = []
-            for tx in transactions:
-                # Format execution times
-                next_execution_formatted = None
-                time_until_execution = None
-                if tx.next_execution:
-                    next_execution_formatted = format_execution_time(tx.next_execution.isoformat())
-                    time_until_execution = get_time_until_execution(tx.next_execution.isoformat())
-                
-                last_execution_formatted = None
-                if tx.last_execution:
-                    last_execution_formatted = format_execution_time(tx.last_execution.isoformat())
-                
-                formatted_transactions.append({
-                    "id": tx.id,
-                    "tool_name": tx.tool_name,
-                    "transaction_type": tx.transaction_type,
-                    "status": tx.status.value,
-                    "created_at": tx.created_at.isoformat(),
-                    "next_execution": tx.next_execution.isoformat() if tx.next_execution else None,
-                    "next_execution_formatted": next_execution_formatted,
-                    "time_until_execution": time_until_execution,
-                    "last_execution": tx.last_execution.isoformat() if tx.last_execution else None,
-                    "last_execution_formatted": last_execution_formatted,
-                    "execution_count": tx.execution_count,
-                    "max_executions": tx.max_executions,
-                    "error_message": tx.error_message,
-                    "notes": tx.metadata.get("notes") if tx.metadata else None,
-                })
+            verbose = input_data.verbose
+            now = datetime.now(timezone.utc)
+            formatted_transactions = [_format_transaction(tx, verbose, now) for tx in transactions]
             
             return {
                 "success": True,
@@ -275,10 +355,10 @@ def create_scheduler_tools(scheduler_service: SchedulerService) -> List[Tool]:
         """Cancel a scheduled transaction."""
         try:
             # Get user_id from context
-            user_id = getattr(scheduler_service, "_current_user_id", "default")
+            user_id = _USER_ID.get()
             
             # Parse input
-            input_data = CancelScheduledTransactionInput(**args)
+            input_data = CancelScheduledTransactionInput.model_validate(args)
             
             # Cancel the transaction
             success = await scheduler_service.cancel_transaction(
@@ -312,42 +392,7 @@ def create_scheduler_tools(scheduler_service: SchedulerService) -> List[Tool]:
                 name="schedule_transaction",
                 description="Schedule a transaction for future execution (once, recurring, or conditional)",
                 namespace="scheduler",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "tool_name": {
-                            "type": "string",
-                            "description": "Name of the tool to execute",
-                            "enum": [
-                                "smart_buy", "smart_sell", "jupiter_swap", "transfer_sol",
-                                "pump_fun_buy", "pump_fun_sell", "aster_open_long", "aster_close_position"
-                            ]
-                        },
-                        "parameters": {
-                            "type": "object",
-                            "description": "Parameters for the tool execution"
-                        },
-                        "schedule_type": {
-                            "type": "string",
-                            "description": "Type of schedule",
-                            "enum": ["once", "recurring", "conditional"]
-                        },
-                        "schedule_config": {
-                            "type": "object",
-                            "description": "Schedule configuration (varies by schedule_type)"
-                        },
-                        "max_executions": {
-                            "type": "integer",
-                            "description": "Maximum number of executions (optional)",
-                            "minimum": 1
-                        },
-                        "notes": {
-                            "type": "string",
-                            "description": "User notes about the transaction (optional)"
-                        }
-                    },
-                    "required": ["tool_name", "parameters", "schedule_type", "schedule_config"]
-                }
+                input_schema=_SCHEDULE_TRANSACTION_SCHEMA,
             ),
             handler=handle_schedule_transaction,
             input_model=ScheduleTransactionInput,
@@ -357,29 +402,7 @@ def create_scheduler_tools(scheduler_service: SchedulerService) -> List[Tool]:
                 name="list_scheduled_transactions",
                 description="List all scheduled transactions for the user",
                 namespace="scheduler",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "status": {
-                            "type": "string",
-                            "description": "Filter by status",
-                            "enum": ["pending", "executed", "failed", "cancelled", "expired"]
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of transactions to return",
-                            "minimum": 1,
-                            "maximum": 200,
-                            "default": 50
-                        },
-                        "offset": {
-                            "type": "integer",
-                            "description": "Offset for pagination",
-                            "minimum": 0,
-                            "default": 0
-                        }
-                    }
-                }
+                input_schema=_LIST_TRANSACTIONS_SCHEMA,
             ),
             handler=handle_list_scheduled_transactions,
             input_model=ListScheduledTransactionsInput,
@@ -389,16 +412,7 @@ def create_scheduler_tools(scheduler_service: SchedulerService) -> List[Tool]:
                 name="cancel_scheduled_transaction",
                 description="Cancel a scheduled transaction",
                 namespace="scheduler",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "transaction_id": {
-                            "type": "integer",
-                            "description": "ID of the transaction to cancel"
-                        }
-                    },
-                    "required": ["transaction_id"]
-                }
+                input_schema=_CANCEL_TRANSACTION_SCHEMA,
             ),
             handler=handle_cancel_scheduled_transaction,
             input_model=CancelScheduledTransactionInput,
@@ -406,6 +420,11 @@ def create_scheduler_tools(scheduler_service: SchedulerService) -> List[Tool]:
     ]
 
 
-def set_scheduler_user_context(scheduler_service: SchedulerService, user_id: str) -> None:
-    """Set the current user context for the scheduler service."""
-    setattr(scheduler_service, "_current_user_id", user_id)
+def set_scheduler_user_context(scheduler_service: SchedulerService, user_id: str) -> Token[str]:
+    """Set the user the scheduler tools act for in the current context.
+
+    The value follows the running task (and tasks it spawns), so concurrent agent
+    runs for different users do not see each other's user. Returns the token for
+    ``_USER_ID.reset``.
+    """
+    return _USER_ID.set(user_id)
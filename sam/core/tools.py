@@ -1,4 +1,4 @@
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Type
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Type
 import logging
 from pydantic import BaseModel, ValidationError
 from dataclasses import dataclass, field
@@ -47,6 +47,15 @@ class ToolRegistry:
             self._logger.warning(f"Overwriting already-registered tool: {name}")
         self._tools[name] = tool
 
+    def register_many(self, tools: Iterable[Tool]) -> None:
+        """Register several tools in one pass."""
+        for tool in tools:
+            self.register(tool)
+
+    def get_tool(self, name: str) -> Optional[Tool]:
+        """Return the registered tool with this name, or None."""
+        return self._tools.get(name)
+
     def add_middleware(self, mw: Middleware) -> None:
         self._middlewares.append(mw)
 
@@ -178,7 +187,7 @@ class ToolRegistry:
         return specs
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Typed wrapper for normalized tool results.
 
@@ -6,8 +6,11 @@ on Solana-based tokens and platforms.
 """
 
 import asyncio
+import copy
+import functools
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple
 from datetime import datetime, timedelta
 import json
 
@@ -46,10 +49,12 @@ async def analyze_token_defi_potential(args: Dict[str, Any]) -> Dict[str, Any]:
                 "error_detail": {"code": "missing_token_address", "message": "Please provide a valid Solana token address"}
             }
         
-        # Get token metadata and market data
-        token_info = await _get_token_metadata(token_address)
-        market_data = await _get_token_market_data(token_address)
-        defi_metrics = await _get_defi_metrics(token_address)
+        # Get token metadata and market data; the three lookups are independent
+        token_info, market_data, defi_metrics = await asyncio.gather(
+            _get_token_metadata(token_address),
+            _get_token_market_data(token_address),
+            _get_defi_metrics(token_address),
+        )
         
         # Generate DeFi strategy recommendations
         strategy = await _generate_defi_strategy(
@@ -107,10 +112,12 @@ async def analyze_defi_platform(args: Dict[str, Any]) -> Dict[str, Any]:
                 "error_detail": {"code": "missing_platform_name", "message": "Please provide a DeFi platform name"}
             }
         
-        # Get platform data and metrics
-        platform_data = await _get_platform_data(platform_name, platform_type)
-        platform_metrics = await _get_platform_metrics(platform_name)
-        opportunities = await _find_platform_opportunities(platform_name, analysis_focus)
+        # Get platform data and metrics concurrently
+        platform_data, platform_metrics, opportunities = await asyncio.gather(
+            _get_platform_data(platform_name, platform_type),
+            _get_platform_metrics(platform_name),
+            _find_platform_opportunities(platform_name, analysis_focus),
+        )
         
         # Generate platform strategy
         strategy = await _generate_platform_strategy(
@@ -223,11 +230,12 @@ async def create_defi_portfolio_strategy(args: Dict[str, Any]) -> Dict[str, Any]
                 "error_detail": {"code": "invalid_amount", "message": "Please provide a valid investment amount"}
             }
         
-        # Analyze current market conditions
-        market_conditions = await _analyze_market_conditions()
-        
-        # Get available opportunities
-        opportunities = await _get_portfolio_opportunities(goals, constraints)
+        # Market conditions, opportunities and the rebalancing schedule are independent
+        market_conditions, opportunities, rebalancing_schedule = await asyncio.gather(
+            _analyze_market_conditions(),
+            _get_portfolio_opportunities(goals, constraints),
+            _create_rebalancing_schedule(investment_horizon),
+        )
         
         # Create portfolio allocation
         portfolio_allocation = await _create_portfolio_allocation(
@@ -252,7 +260,7 @@ async def create_defi_portfolio_strategy(args: Dict[str, Any]) -> Dict[str, Any]
                 },
                 "risk_management": risk_management,
                 "market_conditions": market_conditions,
-                "rebalancing_schedule": await _create_rebalancing_schedule(investment_horizon),
+                "rebalancing_schedule": rebalancing_schedule,
                 "analysis_timestamp": datetime.now().isoformat()
             }
         }
@@ -262,8 +270,109 @@ async def create_defi_portfolio_strategy(args: Dict[str, Any]) -> Dict[str, Any]
         return handle_error_gracefully(e, {"context": "portfolio_strategy"})
 
 
+# Lookup tables for the strategy helpers, built once at import. Helpers hand
+# out copies, so a caller editing its response cannot change them.
+
+_RISK_MULTIPLIER: Dict[str, float] = {"low": 1.0, "medium": 0.8, "high": 0.6}
+
+_RISK_SCORE: Dict[str, int] = {"low": 1, "medium": 2, "high": 3, "very_high": 4}
+
+_STOP_LOSS: Dict[str, int] = {"conservative": 5, "moderate": 10, "aggressive": 15}
+
+_BASE_ALLOCATION_BY_RISK: Dict[str, Dict[str, int]] = {
+    "conservative": {
+        "stable_yield": 60,
+        "moderate_growth": 30,
+        "cash_reserve": 10
+    },
+    "moderate": {
+        "stable_yield": 40,
+        "moderate_growth": 45,
+        "aggressive_growth": 10,
+        "cash_reserve": 5
+    },
+    "aggressive": {
+        "stable_yield": 20,
+        "moderate_growth": 30,
+        "aggressive_growth": 40,
+        "cash_reserve": 10
+    }
+}
+
+_REBALANCING_SCHEDULES: Dict[str, Dict[str, Any]] = {
+    "short": {"frequency": "weekly", "triggers": ["5% deviation", "market events"]},
+    "medium": {"frequency": "monthly", "triggers": ["10% deviation", "quarterly review"]},
+    "long": {"frequency": "quarterly", "triggers": ["15% deviation", "annual review"]}
+}
+
+_PLATFORMS_BY_RISK: Dict[str, List[str]] = {
+    "conservative": ["Solend", "Marinade", "Raydium (stable pairs)"],
+    "moderate": ["Raydium", "Orca", "Jupiter", "Solend"],
+    "aggressive": ["Raydium", "Orca", "Jupiter", "Mango", "Serum"]
+}
+
+_DIVERSIFICATION_RULES: Dict[str, List[str]] = {
+    "conservative": [
+        "Maximum 30% in any single platform",
+        "Focus on established, audited protocols",
+        "Maintain 20% cash reserve"
+    ],
+    "moderate": [
+        "Maximum 25% in any single platform",
+        "Diversify across 3-5 different platforms",
+        "Balance yield and growth opportunities"
+    ],
+    "aggressive": [
+        "Maximum 20% in any single platform",
+        "Diversify across 5+ platforms and strategies",
+        "Include both established and emerging protocols"
+    ]
+}
+
+
 # Helper functions for data gathering and analysis
 
+# Market-facing lookups change on the order of seconds to minutes; cache them briefly.
+# Applied to the per-token market data and DeFi metrics, the per-platform metrics
+# and the global market conditions: each tool call repeats these, and a chat
+# session tends to ask about the same tokens and platforms again within a minute.
+_MARKET_CACHE_TTL = 60
+_MARKET_CACHE_MAX_ENTRIES = 1024
+_market_cache: Dict[Tuple[str, Tuple[Any, ...]], Tuple[float, Any]] = {}
+
+
+def _ttl_cached(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Cache an async lookup per positional arguments for _MARKET_CACHE_TTL seconds.
+
+    Callers get a shallow copy, since results are embedded in tool responses;
+    nested values are still shared and must not be modified. Failed lookups are
+    not cached.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any) -> Any:
+        key = (fn.__name__, args)
+        now = time.monotonic()
+        cached = _market_cache.get(key)
+        if cached is not None and now - cached[0] < _MARKET_CACHE_TTL:
+            return copy.copy(cached[1])
+
+        value = await fn(*args)
+        _market_cache.pop(key, None)
+        if len(_market_cache) >= _MARKET_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del _market_cache[next(iter(_market_cache))]
+        _market_cache[key] = (now, value)
+        return copy.copy(value)
+
+    return wrapper
+
+
+def clear_market_cache() -> None:
+    """Drop all cached market lookups so the next calls refetch."""
+    _market_cache.clear()
+
+
 async def _get_token_metadata(token_address: str) -> Dict[str, Any]:
     """Get token metadata from various sources."""
     # This would integrate with token metadata APIs
@@ -277,6 +386,7 @@ async def _get_token_metadata(token_address: str) -> Dict[str, Any]:
     }
 
 
+@_ttl_cached
 async def _get_token_market_data(token_address: str) -> Dict[str, Any]:
     """Get token market data."""
     # This would integrate with market data APIs
@@ -289,6 +399,7 @@ async def _get_token_market_data(token_address: str) -> Dict[str, Any]:
     }
 
 
+@_ttl_cached
 async def _get_defi_metrics(token_address: str) -> Dict[str, Any]:
     """Get DeFi-specific metrics for the token."""
     return {
@@ -394,6 +505,7 @@ async def _get_platform_data(platform_name: str, platform_type: str) -> Dict[str
     }
 
 
+@_ttl_cached
 async def _get_platform_metrics(platform_name: str) -> Dict[str, Any]:
     """Get platform metrics."""
     return {
@@ -505,7 +617,7 @@ async def _rank_yield_opportunities(opportunities: List[Dict], amount: float, ma
     """Rank yield opportunities by risk-adjusted returns."""
     # Calculate risk-adjusted scores
     for opp in opportunities:
-        risk_multiplier = {"low": 1.0, "medium": 0.8, "high": 0.6}.get(opp["risk_level"], 0.4)
+        risk_multiplier = _RISK_MULTIPLIER.get(opp["risk_level"], 0.4)
         opp["risk_adjusted_score"] = opp["apy"] * risk_multiplier
         opp["suitable_for_amount"] = amount >= opp.get("min_amount", 0)
     
@@ -546,6 +658,7 @@ async def _generate_yield_strategy(opportunities: List[Dict], amount: float, max
     }
 
 
+@_ttl_cached
 async def _analyze_market_conditions() -> Dict[str, Any]:
     """Analyze current market conditions."""
     return {
@@ -583,27 +696,11 @@ async def _create_portfolio_allocation(total_amount: float, risk_tolerance: str,
                                      market_conditions: Dict) -> Dict[str, Any]:
     """Create portfolio allocation strategy."""
     
-    # Base allocation based on risk tolerance
-    if risk_tolerance == "conservative":
-        base_allocation = {
-            "stable_yield": 60,
-            "moderate_growth": 30,
-            "cash_reserve": 10
-        }
-    elif risk_tolerance == "moderate":
-        base_allocation = {
-            "stable_yield": 40,
-            "moderate_growth": 45,
-            "aggressive_growth": 10,
-            "cash_reserve": 5
-        }
-    else:  # aggressive
-        base_allocation = {
-            "stable_yield": 20,
-            "moderate_growth": 30,
-            "aggressive_growth": 40,
-            "cash_reserve": 10
-        }
+    # Base allocation based on risk tolerance (anything unrecognised is treated as aggressive);
+    # copied because the market adjustment below edits it
+    base_allocation = dict(
+        _BASE_ALLOCATION_BY_RISK.get(risk_tolerance, _BASE_ALLOCATION_BY_RISK["aggressive"])
+    )
     
     # Adjust based on market conditions
     if market_conditions["market_sentiment"] == "bearish":
@@ -624,11 +721,7 @@ async def _create_portfolio_allocation(total_amount: float, risk_tolerance: str,
 async def _generate_risk_management_strategy(portfolio_allocation: Dict, risk_tolerance: str) -> Dict[str, Any]:
     """Generate risk management strategy."""
     return {
-        "stop_loss_levels": {
-            "conservative": 5,
-            "moderate": 10,
-            "aggressive": 15
-        }.get(risk_tolerance, 10),
+        "stop_loss_levels": _STOP_LOSS.get(risk_tolerance, 10),
         "position_sizing": "Never risk more than 5% of portfolio on single position",
         "diversification_minimum": "Minimum 5 different positions",
         "rebalancing_triggers": [
@@ -642,19 +735,15 @@ async def _generate_risk_management_strategy(portfolio_allocation: Dict, risk_to
 
 async def _create_rebalancing_schedule(investment_horizon: str) -> Dict[str, Any]:
     """Create rebalancing schedule."""
-    schedules = {
-        "short": {"frequency": "weekly", "triggers": ["5% deviation", "market events"]},
-        "medium": {"frequency": "monthly", "triggers": ["10% deviation", "quarterly review"]},
-        "long": {"frequency": "quarterly", "triggers": ["15% deviation", "annual review"]}
-    }
-    
-    return schedules.get(investment_horizon, schedules["medium"])
+    return copy.deepcopy(
+        _REBALANCING_SCHEDULES.get(investment_horizon, _REBALANCING_SCHEDULES["medium"])
+    )
 
 
 def _assess_portfolio_risk(strategies: List[Dict]) -> Dict[str, Any]:
     """Assess overall portfolio risk."""
     total_risk = sum(
-        {"low": 1, "medium": 2, "high": 3, "very_high": 4}.get(s["risk_level"], 2)
+        _RISK_SCORE.get(s["risk_level"], 2)
         for s in strategies
     ) / len(strategies)
     
@@ -690,36 +779,137 @@ def _calculate_liquidity_requirements(strategies: List[Dict], amount: float) ->
 
 def _get_recommended_platforms(risk_tolerance: str) -> List[str]:
     """Get recommended platforms based on risk tolerance."""
-    platforms = {
-        "conservative": ["Solend", "Marinade", "Raydium (stable pairs)"],
-        "moderate": ["Raydium", "Orca", "Jupiter", "Solend"],
-        "aggressive": ["Raydium", "Orca", "Jupiter", "Mango", "Serum"]
-    }
-    
-    return platforms.get(risk_tolerance, platforms["moderate"])
+    return list(_PLATFORMS_BY_RISK.get(risk_tolerance, _PLATFORMS_BY_RISK["moderate"]))
 
 
 def _get_diversification_rules(risk_tolerance: str) -> List[str]:
     """Get diversification rules based on risk tolerance."""
-    rules = {
-        "conservative": [
-            "Maximum 30% in any single platform",
-            "Focus on established, audited protocols",
-            "Maintain 20% cash reserve"
-        ],
-        "moderate": [
-            "Maximum 25% in any single platform",
-            "Diversify across 3-5 different platforms",
-            "Balance yield and growth opportunities"
-        ],
-        "aggressive": [
-            "Maximum 20% in any single platform",
-            "Diversify across 5+ platforms and strategies",
-            "Include both established and emerging protocols"
-        ]
+    return list(_DIVERSIFICATION_RULES.get(risk_tolerance, _DIVERSIFICATION_RULES["moderate"]))
+
+
+_ANALYZE_TOKEN_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "token_address": {
+            "type": "string",
+            "description": "Solana token address to analyze"
+        },
+        "analysis_depth": {
+            "type": "string",
+            "enum": ["basic", "intermediate", "advanced"],
+            "description": "Depth of analysis to perform",
+            "default": "intermediate"
+        },
+        "risk_tolerance": {
+            "type": "string",
+            "enum": ["conservative", "moderate", "aggressive"],
+            "description": "User's risk tolerance level",
+            "default": "moderate"
+        },
+        "investment_horizon": {
+            "type": "string",
+            "enum": ["short", "medium", "long"],
+            "description": "Investment time horizon",
+            "default": "medium"
+        },
+        "amount": {
+            "type": "number",
+            "description": "Investment amount in SOL (optional)",
+            "default": 0
+        }
+    },
+    "required": ["token_address"]
+}
+
+_ANALYZE_PLATFORM_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "platform_name": {
+            "type": "string",
+            "description": "Name of the DeFi platform (e.g., Raydium, Orca, Jupiter)"
+        },
+        "platform_type": {
+            "type": "string",
+            "description": "Type of platform (DEX, Lending, Yield Farming, etc.)",
+            "default": "DEX"
+        },
+        "analysis_focus": {
+            "type": "string",
+            "enum": ["liquidity", "yields", "risks", "opportunities"],
+            "description": "What to focus the analysis on",
+            "default": "yields"
+        }
+    },
+    "required": ["platform_name"]
+}
+
+_YIELD_OPPORTUNITIES_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "min_apy": {
+            "type": "number",
+            "description": "Minimum APY threshold",
+            "default": 0
+        },
+        "max_risk": {
+            "type": "string",
+            "enum": ["low", "medium", "high"],
+            "description": "Maximum acceptable risk level",
+            "default": "medium"
+        },
+        "token_preference": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Preferred tokens (optional)",
+            "default": []
+        },
+        "platform_preference": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Preferred platforms (optional)",
+            "default": []
+        },
+        "amount": {
+            "type": "number",
+            "description": "Investment amount in SOL",
+            "default": 0
+        }
     }
-    
-    return rules.get(risk_tolerance, rules["moderate"])
+}
+
+_PORTFOLIO_STRATEGY_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "total_amount": {
+            "type": "number",
+            "description": "Total investment amount in SOL"
+        },
+        "risk_tolerance": {
+            "type": "string",
+            "enum": ["conservative", "moderate", "aggressive"],
+            "description": "Risk tolerance level",
+            "default": "moderate"
+        },
+        "investment_horizon": {
+            "type": "string",
+            "enum": ["short", "medium", "long"],
+            "description": "Investment time horizon",
+            "default": "medium"
+        },
+        "goals": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Investment goals (yield, growth, diversification, etc.)",
+            "default": ["yield", "growth"]
+        },
+        "constraints": {
+            "type": "object",
+            "description": "Any constraints (platform preferences, token exclusions, etc.)",
+            "default": {}
+        }
+    },
+    "required": ["total_amount"]
+}
 
 
 # Tool registration
@@ -731,39 +921,7 @@ def register(registry, agent=None):
         spec=ToolSpec(
             name="analyze_token_defi_potential",
             description="Analyze a token's DeFi potential and provide investment strategy recommendations",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "token_address": {
-                        "type": "string",
-                        "description": "Solana token address to analyze"
-                    },
-                    "analysis_depth": {
-                        "type": "string",
-                        "enum": ["basic", "intermediate", "advanced"],
-                        "description": "Depth of analysis to perform",
-                        "default": "intermediate"
-                    },
-                    "risk_tolerance": {
-                        "type": "string",
-                        "enum": ["conservative", "moderate", "aggressive"],
-                        "description": "User's risk tolerance level",
-                        "default": "moderate"
-                    },
-                    "investment_horizon": {
-                        "type": "string",
-                        "enum": ["short", "medium", "long"],
-                        "description": "Investment time horizon",
-                        "default": "medium"
-                    },
-                    "amount": {
-                        "type": "number",
-                        "description": "Investment amount in SOL (optional)",
-                        "default": 0
-                    }
-                },
-                "required": ["token_address"]
-            },
+            input_schema=_ANALYZE_TOKEN_SCHEMA,
             namespace="defi_strategy",
             version="1.0.0"
         ),
@@ -775,27 +933,7 @@ def register(registry, agent=None):
         spec=ToolSpec(
             name="analyze_defi_platform",
             description="Analyze a DeFi platform and provide strategy recommendations",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "platform_name": {
-                        "type": "string",
-                        "description": "Name of the DeFi platform (e.g., Raydium, Orca, Jupiter)"
-                    },
-                    "platform_type": {
-                        "type": "string",
-                        "description": "Type of platform (DEX, Lending, Yield Farming, etc.)",
-                        "default": "DEX"
-                    },
-                    "analysis_focus": {
-                        "type": "string",
-                        "enum": ["liquidity", "yields", "risks", "opportunities"],
-                        "description": "What to focus the analysis on",
-                        "default": "yields"
-                    }
-                },
-                "required": ["platform_name"]
-            },
+            input_schema=_ANALYZE_PLATFORM_SCHEMA,
             namespace="defi_strategy",
             version="1.0.0"
         ),
@@ -807,39 +945,7 @@ def register(registry, agent=None):
         spec=ToolSpec(
             name="get_defi_yield_opportunities",
             description="Find the best DeFi yield opportunities on Solana",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "min_apy": {
-                        "type": "number",
-                        "description": "Minimum APY threshold",
-                        "default": 0
-                    },
-                    "max_risk": {
-                        "type": "string",
-                        "enum": ["low", "medium", "high"],
-                        "description": "Maximum acceptable risk level",
-                        "default": "medium"
-                    },
-                    "token_preference": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Preferred tokens (optional)",
-                        "default": []
-                    },
-                    "platform_preference": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Preferred platforms (optional)",
-                        "default": []
-                    },
-                    "amount": {
-                        "type": "number",
-                        "description": "Investment amount in SOL",
-                        "default": 0
-                    }
-                }
-            },
+            input_schema=_YIELD_OPPORTUNITIES_SCHEMA,
             namespace="defi_strategy",
             version="1.0.0"
         ),
@@ -851,39 +957,7 @@ def register(registry, agent=None):
         spec=ToolSpec(
             name="create_defi_portfolio_strategy",
             description="Create a comprehensive DeFi portfolio strategy",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "total_amount": {
-                        "type": "number",
-                        "description": "Total investment amount in SOL"
-                    },
-                    "risk_tolerance": {
-                        "type": "string",
-                        "enum": ["conservative", "moderate", "aggressive"],
-                        "description": "Risk tolerance level",
-                        "default": "moderate"
-                    },
-                    "investment_horizon": {
-                        "type": "string",
-                        "enum": ["short", "medium", "long"],
-                        "description": "Investment time horizon",
-                        "default": "medium"
-                    },
-                    "goals": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Investment goals (yield, growth, diversification, etc.)",
-                        "default": ["yield", "growth"]
-                    },
-                    "constraints": {
-                        "type": "object",
-                        "description": "Any constraints (platform preferences, token exclusions, etc.)",
-                        "default": {}
-                    }
-                },
-                "required": ["total_amount"]
-            },
+            input_schema=_PORTFOLIO_STRATEGY_SCHEMA,
             namespace="defi_strategy",
             version="1.0.0"
         ),
@@ -145,6 +145,43 @@ async def clear_auth_handler(args: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+_CHECK_AUTH_STATUS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "session_id": {
+            "type": "string",
+            "description": "Optional session identifier (will use current session if not provided)"
+        }
+    }
+}
+
+_REQUEST_PRIVATE_KEY_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "session_id": {
+            "type": "string",
+            "description": "Unique session identifier"
+        },
+        "private_key": {
+            "type": "string",
+            "description": "Base58 encoded Solana private key"
+        }
+    },
+    "required": ["session_id", "private_key"]
+}
+
+_CLEAR_AUTH_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "session_id": {
+            "type": "string",
+            "description": "Unique session identifier"
+        }
+    },
+    "required": ["session_id"]
+}
+
+
 def register(registry, agent=None):
     """Register frontend authentication tools."""
     
@@ -163,15 +200,7 @@ def register(registry, agent=None):
         spec=ToolSpec(
             name="check_auth_status",
             description="Check if the current session has an authenticated private key",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "session_id": {
-                        "type": "string",
-                        "description": "Optional session identifier (will use current session if not provided)"
-                    }
-                }
-            },
+            input_schema=_CHECK_AUTH_STATUS_SCHEMA,
             namespace="frontend_auth",
             version="1.0.0"
         ),
@@ -183,20 +212,7 @@ def register(registry, agent=None):
         spec=ToolSpec(
             name="request_private_key",
             description="Request and store a private key from the frontend chat interface. Use this when you need to perform transactions but don't have access to a private key yet.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "session_id": {
-                        "type": "string",
-                        "description": "Unique session identifier"
-                    },
-                    "private_key": {
-                        "type": "string",
-                        "description": "Base58 encoded Solana private key"
-                    }
-                },
-                "required": ["session_id", "private_key"]
-            },
+            input_schema=_REQUEST_PRIVATE_KEY_SCHEMA,
             namespace="frontend_auth",
             version="1.0.0"
         ),
@@ -209,16 +225,7 @@ def register(registry, agent=None):
         spec=ToolSpec(
             name="clear_auth",
             description="Clear authentication for a session by removing the stored private key. Use this for security purposes.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "session_id": {
-                        "type": "string",
-                        "description": "Unique session identifier"
-                    }
-                },
-                "required": ["session_id"]
-            },
+            input_schema=_CLEAR_AUTH_SCHEMA,
             namespace="frontend_auth",
             version="1.0.0"
         ),
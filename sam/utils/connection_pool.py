@@ -5,9 +5,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import sqlite3
 import time
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Optional, TypedDict
+from urllib.parse import quote
 
 import aiosqlite
 
@@ -60,6 +62,18 @@ class DatabasePool:
 
         logger.info(f"Initialized database pool: {db_path} (max_size: {pool_size})")
 
+    async def _connect(self, timeout: float) -> aiosqlite.Connection:
+        """Open a connection, through the VFS named by SAM_SQLITE_VFS when set."""
+        vfs = os.getenv("SAM_SQLITE_VFS")
+        if vfs and self.db_path != ":memory:":
+            uri = f"file:{quote(os.path.abspath(self.db_path))}?vfs={quote(vfs)}"
+            try:
+                return await aiosqlite.connect(uri, uri=True, timeout=timeout, check_same_thread=False)
+            except sqlite3.OperationalError as e:
+                # VFS not registered in this process (e.g. extension not loaded)
+                logger.warning(f"SQLite VFS '{vfs}' unavailable, using default: {e}")
+        return await aiosqlite.connect(self.db_path, timeout=timeout, check_same_thread=False)
+
     async def _create_connection(self) -> ConnectionInfo:
         """Create a new database connection with metadata."""
         max_retries = 3
@@ -69,7 +83,7 @@ class DatabasePool:
             try:
                 import os as _os
                 _timeout = 10.0 if _os.getenv("SAM_TEST_MODE") == "1" else 30.0
-                conn = await aiosqlite.connect(self.db_path, timeout=_timeout, check_same_thread=False)
+                conn = await self._connect(_timeout)
 
                 # Optimize performance with error handling
                 try:
@@ -4,7 +4,39 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Union
+
+# "in X minutes/hours/days/weeks"
+_RELATIVE_TIME_RE = re.compile(r'in\s+(\d+)\s+(minute|hour|day|week)s?')
+# "at HH:MM AM/PM", then "at HH:MM"
+_ABSOLUTE_TIME_RES = (
+    re.compile(r'at\s+(\d{1,2}):(\d{2})\s*(am|pm)'),
+    re.compile(r'at\s+(\d{1,2}):(\d{2})'),
+)
+# "tomorrow at HH:MM [AM/PM]"
+_TOMORROW_RE = re.compile(r'tomorrow\s+at\s+(\d{1,2}):(\d{2})\s*(am|pm)?')
+# "next <weekday> at HH:MM [AM/PM]"
+_NEXT_DAY_RE = re.compile(
+    r'next\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+at\s+(\d{1,2}):(\d{2})\s*(am|pm)?'
+)
+_UNIT_DELTAS: Dict[str, timedelta] = {
+    'minute': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+}
+# Monday = 0, Sunday = 6
+_DAY_NUMBERS: Dict[str, int] = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+
+def _to_24_hour(hour: int, ampm: Optional[str]) -> int:
+    """Convert a 12-hour clock hour to 24-hour; hours without am/pm are already 24-hour."""
+    if not ampm:
+        return hour
+    return hour % 12 + (12 if ampm == 'pm' else 0)
 
 
 def calculate_execution_time(time_expression: str) -> Optional[str]:
@@ -43,49 +75,23 @@ def calculate_execution_time(time_expression: str) -> Optional[str]:
 
 def _parse_relative_time(time_str: str, base_time: datetime) -> Optional[datetime]:
     """Parse relative time expressions like 'in 3 minutes', 'in 1 hour', etc."""
-    
-    # Pattern for "in X minutes/hours/days/weeks"
-    relative_pattern = r'in\s+(\d+)\s+(minute|hour|day|week)s?'
-    match = re.search(relative_pattern, time_str)
-    
+    match = _RELATIVE_TIME_RE.search(time_str)
     if match:
-        amount = int(match.group(1))
-        unit = match.group(2)
-        
-        if unit == 'minute':
-            return base_time + timedelta(minutes=amount)
-        elif unit == 'hour':
-            return base_time + timedelta(hours=amount)
-        elif unit == 'day':
-            return base_time + timedelta(days=amount)
-        elif unit == 'week':
-            return base_time + timedelta(weeks=amount)
+        return base_time + int(match.group(1)) * _UNIT_DELTAS[match.group(2)]
     
     return None
 
 
 def _parse_absolute_time(time_str: str, base_time: datetime) -> Optional[datetime]:
     """Parse absolute time expressions like 'at 9:00 AM', 'at 15:30', etc."""
-    
-    # Pattern for "at HH:MM AM/PM" or "at HH:MM"
-    time_patterns = [
-        r'at\s+(\d{1,2}):(\d{2})\s*(am|pm)',
-        r'at\s+(\d{1,2}):(\d{2})',
-    ]
-    
-    for pattern in time_patterns:
-        match = re.search(pattern, time_str)
+    for pattern in _ABSOLUTE_TIME_RES:
+        match = pattern.search(time_str)
         if match:
             hour = int(match.group(1))
             minute = int(match.group(2))
             ampm = match.group(3) if len(match.groups()) > 2 else None
             
-            # Convert to 24-hour format
-            if ampm:
-                if ampm == 'pm' and hour != 12:
-                    hour += 12
-                elif ampm == 'am' and hour == 12:
-                    hour = 0
+            hour = _to_24_hour(hour, ampm)
             
             # Create target time for today
             target_time = base_time.replace(hour=hour, minute=minute, second=0, microsecond=0)
@@ -103,45 +109,28 @@ def _parse_specific_time(time_str: str, base_time: datetime) -> Optional[datetim
     """Parse specific date/time expressions like 'tomorrow at 10:00', 'next Monday', etc."""
     
     # Handle "tomorrow at X:XX"
-    tomorrow_pattern = r'tomorrow\s+at\s+(\d{1,2}):(\d{2})\s*(am|pm)?'
-    match = re.search(tomorrow_pattern, time_str)
+    match = _TOMORROW_RE.search(time_str)
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2))
         ampm = match.group(3)
         
-        # Convert to 24-hour format
-        if ampm:
-            if ampm == 'pm' and hour != 12:
-                hour += 12
-            elif ampm == 'am' and hour == 12:
-                hour = 0
+        hour = _to_24_hour(hour, ampm)
         
         tomorrow = base_time + timedelta(days=1)
         return tomorrow.replace(hour=hour, minute=minute, second=0, microsecond=0)
     
     # Handle "next [day] at X:XX"
-    next_day_pattern = r'next\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+at\s+(\d{1,2}):(\d{2})\s*(am|pm)?'
-    match = re.search(next_day_pattern, time_str)
+    match = _NEXT_DAY_RE.search(time_str)
     if match:
         day_name = match.group(1).lower()
         hour = int(match.group(2))
         minute = int(match.group(3))
         ampm = match.group(4)
         
-        # Convert to 24-hour format
-        if ampm:
-            if ampm == 'pm' and hour != 12:
-                hour += 12
-            elif ampm == 'am' and hour == 12:
-                hour = 0
+        hour = _to_24_hour(hour, ampm)
         
-        # Map day names to numbers (Monday = 0, Sunday = 6)
-        day_map = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-        target_day = day_map[day_name]
+        target_day = _DAY_NUMBERS[day_name]
         
         # Calculate days until next occurrence
         current_day = base_time.weekday()
@@ -155,20 +144,32 @@ def _parse_specific_time(time_str: str, base_time: datetime) -> Optional[datetim
     return None
 
 
-def format_execution_time(iso_timestamp: str) -> str:
-    """Format ISO timestamp for user-friendly display."""
+def _as_datetime(timestamp: Union[str, datetime]) -> datetime:
+    """Return a datetime as is, or parse an ISO timestamp string."""
+    if isinstance(timestamp, datetime):
+        return timestamp
+    return datetime.fromisoformat(timestamp)
+
+
+def format_execution_time(iso_timestamp: Union[str, datetime]) -> str:
+    """Format ISO timestamp (or datetime) for user-friendly display."""
     try:
-        dt = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
+        dt = _as_datetime(iso_timestamp)
         return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
     except:
         return iso_timestamp
 
 
-def get_time_until_execution(iso_timestamp: str) -> Optional[str]:
-    """Get human-readable time until execution."""
+def get_time_until_execution(
+    iso_timestamp: Union[str, datetime], now: Optional[datetime] = None
+) -> Optional[str]:
+    """Get human-readable time until execution from an ISO timestamp or datetime.
+
+    Pass ``now`` to measure several timestamps against one clock reading.
+    """
     try:
-        execution_time = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
+        execution_time = _as_datetime(iso_timestamp)
+        now = now or datetime.now(timezone.utc)
         
         if execution_time <= now:
             return "Past due"
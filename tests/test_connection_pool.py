@@ -49,6 +49,20 @@ class TestDatabasePool:
         # Cleanup
         await conn_info["connection"].close()
 
+    @pytest.mark.asyncio
+    async def test_create_connection_with_vfs(self, db_pool, monkeypatch):
+        """Test SAM_SQLITE_VFS opens through the named VFS, falling back if missing."""
+        for vfs in ("unix-dotfile", "no-such-vfs"):
+            monkeypatch.setenv("SAM_SQLITE_VFS", vfs)
+            conn_info = await db_pool._create_connection()
+            conn = conn_info["connection"]
+            await conn.execute("CREATE TABLE IF NOT EXISTS t (x INTEGER)")
+            await conn.execute("INSERT INTO t VALUES (1)")
+            await conn.commit()
+            await conn.close()
+
+        assert os.path.exists(db_pool.db_path)
+
     @pytest.mark.asyncio
     async def test_connection_validation_valid(self, db_pool):
         """Test connection validation for valid connection."""
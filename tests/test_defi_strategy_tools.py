@@ -0,0 +1,132 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from sam.integrations import defi_strategy_tools
+from sam.integrations.defi_strategy_tools import (
+    _get_token_market_data,
+    _ttl_cached,
+    clear_market_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_market_cache():
+    """Start and finish every test with an empty market cache."""
+    clear_market_cache()
+    yield
+    clear_market_cache()
+
+
+@pytest.mark.asyncio
+async def test_market_cache_hit_within_ttl_and_miss_after():
+    """Test cached lookups are reused within the TTL and refetched after it."""
+    fetch = AsyncMock(return_value={"price": 1.0})
+    cached_fetch = _ttl_cached(fetch)
+
+    with patch.object(defi_strategy_tools.time, "monotonic", return_value=1000.0):
+        assert await cached_fetch("mint") == {"price": 1.0}
+        assert await cached_fetch("mint") == {"price": 1.0}
+    assert fetch.await_count == 1
+
+    with patch.object(defi_strategy_tools.time, "monotonic", return_value=1000.0 + 60):
+        await cached_fetch("mint")
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_market_cache_does_not_cache_failures():
+    """Test a failed lookup is retried on the next call."""
+    fetch = AsyncMock(side_effect=[RuntimeError("down"), {"price": 1.0}])
+    cached_fetch = _ttl_cached(fetch)
+
+    with pytest.raises(RuntimeError):
+        await cached_fetch("mint")
+    assert await cached_fetch("mint") == {"price": 1.0}
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_market_cache_evicts_oldest_entry():
+    """Test the oldest entry is dropped once the cache is full."""
+    fetch = AsyncMock(side_effect=lambda key: {"key": key})
+    cached_fetch = _ttl_cached(fetch)
+
+    with patch.object(defi_strategy_tools, "_MARKET_CACHE_MAX_ENTRIES", 2):
+        for key in ("a", "b", "c"):
+            await cached_fetch(key)
+        assert [args for (_, args) in defi_strategy_tools._market_cache] == [("b",), ("c",)]
+
+        await cached_fetch("a")
+    assert fetch.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_clear_market_cache_forces_refetch():
+    """Test clearing the cache makes the next call fetch again."""
+    fetch = AsyncMock(return_value={"price": 1.0})
+    cached_fetch = _ttl_cached(fetch)
+
+    await cached_fetch("mint")
+    clear_market_cache()
+    assert defi_strategy_tools._market_cache == {}
+    await cached_fetch("mint")
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_market_cache_returns_copies():
+    """Test callers editing a cached result do not change what later callers see."""
+    first = await _get_token_market_data("mint")
+    first["price"] = -1
+    second = await _get_token_market_data("mint")
+
+    assert second["price"] == 0.001
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_lookup_failure_reported_instead_of_analyzed():
+    """Test a failed concurrent lookup surfaces as an error rather than empty data."""
+    failing = AsyncMock(side_effect=RuntimeError("metrics provider unavailable"))
+
+    with patch.object(defi_strategy_tools, "_get_defi_metrics", failing):
+        result = await defi_strategy_tools.analyze_token_defi_potential({"token_address": "mint"})
+
+    assert result["error"] is True
+    assert "success" not in result
+
+
+@pytest.mark.asyncio
+async def test_strategy_lookups_return_copies_of_shared_tables():
+    """Test editing a returned schedule or list leaves the module tables untouched."""
+    schedule = await defi_strategy_tools._create_rebalancing_schedule("short")
+    schedule["triggers"].append("edited")
+    platforms = defi_strategy_tools._get_recommended_platforms("moderate")
+    platforms.append("edited")
+    rules = defi_strategy_tools._get_diversification_rules("moderate")
+    rules.append("edited")
+
+    assert "edited" not in (await defi_strategy_tools._create_rebalancing_schedule("short"))["triggers"]
+    assert "edited" not in defi_strategy_tools._get_recommended_platforms("moderate")
+    assert "edited" not in defi_strategy_tools._get_diversification_rules("moderate")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "lookup, args",
+    [
+        ("_get_token_market_data", ("mint",)),
+        ("_get_defi_metrics", ("mint",)),
+        ("_get_platform_metrics", ("Raydium",)),
+        ("_analyze_market_conditions", ()),
+    ],
+)
+async def test_market_lookups_are_cached(lookup, args):
+    """Test each market-facing lookup stores one entry that repeat calls are served from."""
+    cached_lookup = getattr(defi_strategy_tools, lookup)
+
+    first = await cached_lookup(*args)
+    second = await cached_lookup(*args)
+
+    assert first == second
+    assert list(defi_strategy_tools._market_cache) == [(lookup, args)]
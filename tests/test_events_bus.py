@@ -79,3 +79,22 @@ async def test_agent_publishes_tool_and_usage_events():
     called_payload = next(p for e, p in events if e == "tool.called")
     assert called_payload["name"] == "echo_tool"
     assert called_payload["tool_call_id"] == "evt_call_1"
+
+
+@pytest.mark.asyncio
+async def test_publish_nowait_delivers_after_drain():
+    bus = EventBus()
+    received = []
+
+    async def on_event(event, payload):
+        received.append((event, payload["n"]))
+
+    bus.subscribe("tick", on_event)
+    bus.publish_nowait("tick", {"n": 1})
+    bus.publish_nowait("tick", {"n": 2})
+    # Handlers run later, not inside publish_nowait
+    assert received == []
+
+    await bus.drain()
+    assert received == [("tick", 1), ("tick", 2)]
+    assert not bus._pending
@@ -7,6 +7,7 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from sam.core.scheduler.models import (
+    TRANSACTION_COLUMNS,
     ScheduledTransaction,
     ScheduleTransactionInput,
     ScheduleType,
@@ -17,10 +18,16 @@ from sam.core.scheduler.models import (
 )
 from sam.core.scheduler.scheduler_service import SchedulerService
 from sam.core.scheduler.executor import ScheduledTransactionExecutor
-from sam.core.scheduler.tools import create_scheduler_tools, set_scheduler_user_context
+from sam.core.scheduler.tools import (
+    _parse_time_expression,
+    _to_24_hour,
+    create_scheduler_tools,
+    set_scheduler_user_context,
+    validate_and_fix_schedule_config,
+)
 from sam.core.memory import MemoryManager
 from sam.core.events import EventBus
-from sam.core.tools import ToolRegistry
+from sam.core.tools import Tool, ToolRegistry, ToolResult, ToolSpec
 from sam.utils.time_helpers import (
     calculate_execution_time,
     format_execution_time,
@@ -63,6 +70,31 @@ def mock_tool():
     return tool
 
 
+# A mint that passes address validation, for transactions the scheduler executes
+_VALID_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+
+def _buy_input(execute_at=None, mint="test_mint", **parameters):
+    """Build a one-off smart_buy schedule, due an hour from now unless execute_at is given."""
+    if execute_at is None:
+        execute_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    if isinstance(execute_at, datetime):
+        execute_at = execute_at.isoformat()
+    return ScheduleTransactionInput(
+        tool_name="smart_buy",
+        parameters={"mint": mint, "amount_sol": 0.1, **parameters},
+        schedule_type=ScheduleType.ONCE,
+        schedule_config={"execute_at": execute_at},
+    )
+
+
+def _register_tool(tool_registry, handler, name="smart_buy"):
+    """Register a tool with an empty schema whose calls go to handler."""
+    tool_registry.register(
+        Tool(spec=ToolSpec(name=name, description=name, input_schema={}), handler=handler)
+    )
+
+
 class TestScheduledTransactionModels:
     """Test scheduled transaction data models."""
 
@@ -78,6 +110,17 @@ class TestScheduledTransactionModels:
         with pytest.raises(ValueError, match="execute_at must be in the future"):
             OnceScheduleConfig(execute_at=past_date)
 
+    def test_schedule_config_parses_iso_strings(self):
+        """Test ISO strings with a Z suffix parse as UTC and bad strings are rejected."""
+        config = OnceScheduleConfig(execute_at="2030-01-01T10:00:00Z")
+        assert config.execute_at == datetime(2030, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+        config = RecurringScheduleConfig(frequency="daily", start_date="2030-01-01T10:00:00Z")
+        assert config.start_date.utcoffset() == timedelta(0)
+
+        with pytest.raises(ValueError, match="Invalid datetime format"):
+            OnceScheduleConfig(execute_at="not-a-date")
+
     def test_recurring_schedule_config_validation(self):
         """Test recurring schedule config validation."""
         # Valid daily schedule
@@ -161,6 +204,66 @@ class TestScheduledTransactionModels:
         assert restored.status == transaction.status
         assert restored.parameters == transaction.parameters
 
+        # Test from_row reads a positional database row
+        row = (7, *(data[column] for column in TRANSACTION_COLUMNS[1:]))
+        restored = ScheduledTransaction.from_row(row)
+        assert restored.id == 7
+        assert restored.schedule_config == transaction.schedule_config
+
+    def test_from_rows_batch_matches_from_row(self):
+        """Test batch hydration parses large row sets the same as row by row."""
+        future_date = datetime.now(timezone.utc) + timedelta(hours=1)
+        rows = []
+        for i in range(40):
+            data = ScheduledTransaction(
+                user_id="test_user",
+                transaction_type="buy",
+                tool_name="smart_buy",
+                parameters={"mint": "test_mint", "amount_sol": i / 10},
+                schedule_config=OnceScheduleConfig(execute_at=future_date),
+                metadata={"notes": f"note {i}"} if i % 2 else None,
+            ).to_dict()
+            rows.append((i, *(data[column] for column in TRANSACTION_COLUMNS[1:])))
+
+        expected = [ScheduledTransaction.from_row(row) for row in rows]
+        assert ScheduledTransaction.from_rows(rows) == expected
+        with patch("sam.core.scheduler.models.orjson", None):
+            assert ScheduledTransaction.from_rows(rows) == expected
+
+    def test_schedule_config_restored_by_type(self):
+        """Test from_dict picks the config model from the stored schedule type."""
+        transaction = ScheduledTransaction(
+            user_id="test_user",
+            transaction_type="buy",
+            tool_name="smart_buy",
+            parameters={"mint": "test_mint", "amount_sol": 0.1},
+            schedule_config=RecurringScheduleConfig(frequency="weekly", days_of_week=[1, 3]),
+        )
+
+        restored = ScheduledTransaction.from_dict(transaction.to_dict())
+        assert isinstance(restored.schedule_config, RecurringScheduleConfig)
+        assert restored.schedule_config.days_of_week == [1, 3]
+
+        # Same round trip through the stdlib codec when orjson is not installed
+        with patch("sam.core.scheduler.models.orjson", None):
+            restored = ScheduledTransaction.from_dict(transaction.to_dict())
+        assert restored.schedule_config.days_of_week == [1, 3]
+
+        # Nested datetimes in free-form config are stored as ISO strings
+        transaction = transaction.model_copy(update={
+            "schedule_config": ConditionalScheduleConfig(
+                condition_type="price_target",
+                condition_config={"until": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+            )
+        })
+        stored = json.loads(transaction.to_dict()["schedule_config"])
+        assert stored["condition_config"]["until"].startswith("2024-01-01T00:00:00")
+
+        data = transaction.to_dict()
+        data["schedule_type"] = "unknown"
+        with pytest.raises(ValueError):
+            ScheduledTransaction.from_dict(data)
+
 
 class TestSchedulerService:
     """Test scheduler service functionality."""
@@ -223,10 +326,12 @@ class TestSchedulerService:
         )
         
         transaction_id = await scheduler_service.schedule_transaction("test_user", input_data)
+        scheduler_service._schedule_changed = False
         
         # Cancel the transaction
         success = await scheduler_service.cancel_transaction(int(transaction_id), "test_user")
         assert success
+        assert scheduler_service._schedule_changed
         
         # Verify transaction was cancelled
         transactions = await scheduler_service.list_user_transactions("test_user")
@@ -259,6 +364,593 @@ class TestSchedulerService:
         )
         assert len(pending_transactions) == 3
 
+    @pytest.mark.asyncio
+    async def test_concurrent_listings_share_one_query(self, scheduler_service, tool_registry):
+        """Test identical concurrent listings are served by a single query."""
+        scheduler_service.set_tool_registry(tool_registry)
+        await scheduler_service.schedule_transaction(
+            "test_user",
+            _buy_input(),
+        )
+
+        with patch.object(
+            scheduler_service, "_query_user_transactions", wraps=scheduler_service._query_user_transactions
+        ) as query:
+            first, second, other_page = await asyncio.gather(
+                scheduler_service.list_user_transactions("test_user"),
+                scheduler_service.list_user_transactions("test_user"),
+                scheduler_service.list_user_transactions("test_user", offset=1),
+            )
+            assert query.call_count == 2
+
+            # Once finished, the next call queries again
+            await scheduler_service.list_user_transactions("test_user")
+            assert query.call_count == 3
+
+        assert len(first) == len(second) == 1
+        assert first is not second
+        assert other_page == []
+        assert scheduler_service._listings == {}
+
+    @pytest.mark.asyncio
+    async def test_listing_after_write_does_not_join_older_query(self, scheduler_service, tool_registry):
+        """Test a listing issued after a write sees it, even if an older listing is in flight."""
+        scheduler_service.set_tool_registry(tool_registry)
+        original_query = scheduler_service._query_user_transactions
+        release = asyncio.Event()
+
+        async def slow_query(*args):
+            rows = await original_query(*args)
+            await release.wait()
+            return rows
+
+        with patch.object(scheduler_service, "_query_user_transactions", side_effect=slow_query) as query:
+            stale = asyncio.create_task(scheduler_service.list_user_transactions("test_user"))
+            await asyncio.sleep(0.05)
+
+            await scheduler_service.schedule_transaction(
+                "test_user",
+                _buy_input(),
+            )
+            fresh = asyncio.create_task(scheduler_service.list_user_transactions("test_user"))
+            await asyncio.sleep(0.05)
+            release.set()
+
+            assert await stale == []
+            assert len(await fresh) == 1
+            assert query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_events_delivered_when_not_running(self, scheduler_service, tool_registry, event_bus):
+        """Test schedule and cancel events are delivered inline when the service is stopped."""
+        scheduler_service.set_tool_registry(tool_registry)
+        received = []
+
+        async def on_event(event, payload):
+            received.append((event, payload["transaction_id"]))
+
+        event_bus.subscribe("scheduler.transaction_scheduled", on_event)
+        event_bus.subscribe("scheduler.transaction_cancelled", on_event)
+
+        transaction_id = int(await scheduler_service.schedule_transaction(
+            "test_user",
+            _buy_input(),
+        ))
+        assert await scheduler_service.cancel_transaction(transaction_id, "test_user")
+
+        assert received == [
+            ("scheduler.transaction_scheduled", transaction_id),
+            ("scheduler.transaction_cancelled", transaction_id),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_new_schedule_wakes_execution_loop(self, scheduler_service, tool_registry):
+        """Test a newly scheduled due transaction runs without waiting for a poll."""
+        handler = AsyncMock(return_value={"success": True})
+        _register_tool(tool_registry, handler)
+        scheduler_service.set_tool_registry(tool_registry)
+
+        await scheduler_service.start()
+        try:
+            # Let the loop go idle before scheduling
+            await asyncio.sleep(0.05)
+            input_data = _buy_input(datetime.now(timezone.utc), mint=_VALID_MINT)
+            await scheduler_service.schedule_transaction("test_user", input_data)
+
+            for _ in range(50):
+                if handler.called:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await scheduler_service.stop()
+
+        handler.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_due_transactions_sharded_by_user_and_tool(self, scheduler_service, tool_registry):
+        """Test different users run concurrently while one user's transactions stay ordered."""
+        running = set()
+        overlaps = []
+
+        async def handler(params):
+            running.add(params["tag"])
+            overlaps.append(set(running))
+            await asyncio.sleep(0.05)
+            running.discard(params["tag"])
+            return {"success": True}
+
+        _register_tool(tool_registry, handler)
+        scheduler_service.set_tool_registry(tool_registry)
+
+        now = datetime.now(timezone.utc).isoformat()
+        for user_id, tag in [("alice", "a1"), ("alice", "a2"), ("bob", "b1")]:
+            await scheduler_service.schedule_transaction(
+                user_id,
+                _buy_input(now, mint=_VALID_MINT, tag=tag),
+            )
+
+        # Run through the service so every query shares its dedicated connection
+        await scheduler_service.start()
+        try:
+            for _ in range(50):
+                if len(overlaps) == 3 and not running:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await scheduler_service.stop()
+
+        assert {"a1", "b1"} in overlaps
+        assert not any({"a1", "a2"} <= seen for seen in overlaps)
+        for user_id in ("alice", "bob"):
+            transactions = await scheduler_service.list_user_transactions(user_id)
+            assert all(t.status == TransactionStatus.EXECUTED for t in transactions)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_executions_are_bounded(self, scheduler_service, tool_registry):
+        """Test shards share a bounded number of execution slots."""
+        running = 0
+        peak = 0
+        done = 0
+
+        async def handler(params):
+            nonlocal running, peak, done
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            done += 1
+            return {"success": True}
+
+        _register_tool(tool_registry, handler)
+        scheduler_service.set_tool_registry(tool_registry)
+        scheduler_service._execution_slots = asyncio.Semaphore(2)
+
+        now = datetime.now(timezone.utc).isoformat()
+        for i in range(5):
+            await scheduler_service.schedule_transaction(
+                f"user_{i}",
+                _buy_input(now, mint=_VALID_MINT),
+            )
+
+        await scheduler_service.start()
+        try:
+            for _ in range(50):
+                if done == 5:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await scheduler_service.stop()
+
+        assert done == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_transaction_not_executed_twice_concurrently(self, scheduler_service, tool_registry):
+        """Test overlapping passes run the same transaction only once."""
+        calls = 0
+
+        async def handler(params):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"success": True}
+
+        _register_tool(tool_registry, handler)
+        scheduler_service.set_tool_registry(tool_registry)
+
+        # Not yet due, so the running loop leaves it alone
+        later = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        await scheduler_service.schedule_transaction(
+            "user_1",
+            _buy_input(later, mint=_VALID_MINT),
+        )
+
+        await scheduler_service.start()
+        try:
+            [transaction] = await scheduler_service.list_user_transactions("user_1")
+            now = datetime.now(timezone.utc)
+            await asyncio.gather(
+                scheduler_service._process_shard([transaction], now),
+                scheduler_service._process_shard([transaction], now),
+            )
+            assert transaction.id not in scheduler_service._tx_locks
+        finally:
+            await scheduler_service.stop()
+
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_backlog_drained_in_batches_without_waiting(self, scheduler_service, tool_registry):
+        """Test a backlog larger than one batch is drained pass after pass."""
+        handler = AsyncMock(return_value={"success": True})
+        _register_tool(tool_registry, handler)
+        scheduler_service.set_tool_registry(tool_registry)
+
+        overdue = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+        for i in range(5):
+            await scheduler_service.schedule_transaction(
+                f"user_{i}",
+                _buy_input(overdue, mint=_VALID_MINT),
+            )
+
+        with patch("sam.core.scheduler.scheduler_service._DUE_BATCH_SIZE", 2):
+            await scheduler_service.start()
+            try:
+                # Well under the one-second backoff used between partial passes
+                for _ in range(40):
+                    if handler.call_count == 5:
+                        break
+                    await asyncio.sleep(0.02)
+            finally:
+                await scheduler_service.stop()
+
+        assert handler.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_while_running(self, scheduler_service, tool_registry):
+        """Test writes queued from concurrent callers are all applied."""
+        scheduler_service.set_tool_registry(tool_registry)
+        future_date = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        await scheduler_service.start()
+        try:
+            transaction_ids = await asyncio.gather(*(
+                scheduler_service.schedule_transaction(
+                    "test_user",
+                    _buy_input(future_date, mint=f"test_mint_{i}"),
+                )
+                for i in range(10)
+            ))
+            assert len(set(transaction_ids)) == 10
+
+            # Only the owner can cancel
+            assert not await scheduler_service.cancel_transaction(int(transaction_ids[0]), "other_user")
+            assert await scheduler_service.cancel_transaction(int(transaction_ids[0]), "test_user")
+        finally:
+            await scheduler_service.stop()
+
+        transactions = await scheduler_service.list_user_transactions("test_user")
+        assert len(transactions) == 10
+        cancelled = [t for t in transactions if t.status == TransactionStatus.CANCELLED]
+        assert [str(t.id) for t in cancelled] == [transaction_ids[0]]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_status_updates_are_batched(self, scheduler_service, tool_registry):
+        """Test concurrent status updates of the same kind all land."""
+        scheduler_service.set_tool_registry(tool_registry)
+        future_date = datetime.now(timezone.utc) + timedelta(hours=1)
+        transaction_ids = []
+        for i in range(5):
+            transaction_ids.append(int(await scheduler_service.schedule_transaction(
+                "test_user",
+                _buy_input(future_date, mint=f"test_mint_{i}"),
+            )))
+
+        await scheduler_service.start()
+        try:
+            await asyncio.gather(*(
+                scheduler_service._mark_transaction_failed(transaction_id, f"error {transaction_id}")
+                for transaction_id in transaction_ids
+            ))
+        finally:
+            await scheduler_service.stop()
+
+        transactions = await scheduler_service.list_user_transactions("test_user")
+        assert {t.id: t.error_message for t in transactions} == {
+            transaction_id: f"error {transaction_id}" for transaction_id in transaction_ids
+        }
+        assert all(t.status == TransactionStatus.FAILED for t in transactions)
+
+    @pytest.mark.asyncio
+    async def test_due_transactions_use_epoch_column(self, scheduler_service, tool_registry):
+        """Test due selection compares the integer epoch column."""
+        scheduler_service.set_tool_registry(tool_registry)
+        now = datetime.now(timezone.utc)
+        for i, execute_at in enumerate([now - timedelta(seconds=5), now + timedelta(hours=1)]):
+            await scheduler_service.schedule_transaction(
+                "test_user",
+                _buy_input(execute_at, mint=f"test_mint_{i}"),
+            )
+
+        due = await scheduler_service._get_due_transactions()
+        assert [t.parameters["mint"] for t in due] == ["test_mint_0"]
+
+    @pytest.mark.asyncio
+    async def test_due_heap_tracks_pending_transactions(self, scheduler_service, tool_registry):
+        """Test due rows come from the in-memory heap while running, skipping stale entries."""
+        scheduler_service.set_tool_registry(tool_registry)
+        now = datetime.now(timezone.utc)
+
+        async def schedule(mint, execute_at):
+            return int(await scheduler_service.schedule_transaction(
+                "test_user",
+                _buy_input(execute_at, mint=mint),
+            ))
+
+        # Scheduled before start: picked up when the heap is loaded
+        early_id = await schedule("early", now - timedelta(seconds=5))
+        assert scheduler_service._due_heap is None
+
+        with patch.object(scheduler_service, "_execution_loop", AsyncMock()):
+            await scheduler_service.start()
+        try:
+            assert [entry[1] for entry in scheduler_service._due_heap] == [early_id]
+
+            cancelled_id = await schedule("cancelled", now - timedelta(seconds=1))
+            await schedule("later", now + timedelta(hours=1))
+            assert await scheduler_service.cancel_transaction(cancelled_id, "test_user")
+            assert len(scheduler_service._due_heap) == 3
+
+            due = await scheduler_service._get_due_transactions()
+            assert [t.id for t in due] == [early_id]
+            assert len(scheduler_service._due_heap) == 1
+            assert await scheduler_service._seconds_until_next_due() == 300.0
+            assert await scheduler_service._get_due_transactions() == []
+
+            # Idle passes return before touching the table
+            with patch.object(scheduler_service, "_get_due_transactions", AsyncMock()) as get_due:
+                assert await scheduler_service._process_due_transactions() == 0
+            get_due.assert_not_called()
+        finally:
+            await scheduler_service.stop()
+
+        assert scheduler_service._due_heap is None
+
+    @pytest.mark.asyncio
+    async def test_due_heap_keeps_unprocessed_transactions(self, scheduler_service, tool_registry):
+        """Test popped ids go back on the heap when the fetch fails or the transaction is not run."""
+        scheduler_service.set_tool_registry(tool_registry)
+        execute_at = datetime.now(timezone.utc) - timedelta(seconds=5)
+        transaction_id = int(await scheduler_service.schedule_transaction(
+            "test_user",
+            _buy_input(execute_at),
+        ))
+
+        with patch.object(scheduler_service, "_execution_loop", AsyncMock()):
+            await scheduler_service.start()
+        try:
+            with patch.object(scheduler_service, "_connection", side_effect=RuntimeError("db down")):
+                assert await scheduler_service._get_due_transactions() == []
+            assert [entry[1] for entry in scheduler_service._due_heap] == [transaction_id]
+
+            [transaction] = await scheduler_service._get_due_transactions()
+            assert scheduler_service._due_heap == []
+            now = datetime.now(timezone.utc)
+
+            # Skipped because another pass holds its lock
+            lock = asyncio.Lock()
+            scheduler_service._tx_locks[transaction.id] = lock
+            await lock.acquire()
+            await scheduler_service._process_shard([transaction], now)
+            lock.release()
+            assert [entry[1] for entry in scheduler_service._due_heap] == [transaction_id]
+            scheduler_service._due_heap.clear()
+
+            # Processing raised before an outcome was recorded
+            with patch.object(
+                scheduler_service, "_process_transaction", AsyncMock(side_effect=RuntimeError("boom"))
+            ):
+                await scheduler_service._process_shard([transaction], now)
+            assert [entry[1] for entry in scheduler_service._due_heap] == [transaction_id]
+            assert not lock.locked()
+        finally:
+            await scheduler_service.stop()
+
+    @pytest.mark.asyncio
+    async def test_wait_until_next_due_is_sub_second(self, scheduler_service, tool_registry):
+        """Test the loop sleeps exactly until a transaction due in under a second."""
+        scheduler_service.set_tool_registry(tool_registry)
+        assert await scheduler_service._seconds_until_next_due() == 300.0
+
+        await scheduler_service.schedule_transaction(
+            "test_user",
+            _buy_input(datetime.now(timezone.utc) + timedelta(seconds=0.5)),
+        )
+
+        assert 0 < await scheduler_service._seconds_until_next_due() <= 0.5
+
+    @pytest.mark.asyncio
+    async def test_epoch_column_backfilled_on_upgrade(self, tmp_path):
+        """Test databases created before next_execution_us get it populated."""
+        import sqlite3
+
+        db_path = str(tmp_path / "legacy.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE scheduled_transactions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id TEXT NOT NULL,
+                    transaction_type TEXT NOT NULL,
+                    tool_name TEXT NOT NULL,
+                    parameters TEXT NOT NULL,
+                    schedule_type TEXT NOT NULL,
+                    schedule_config TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    created_at TEXT NOT NULL,
+                    next_execution TEXT,
+                    last_execution TEXT,
+                    execution_count INTEGER DEFAULT 0,
+                    max_executions INTEGER,
+                    error_message TEXT,
+                    metadata TEXT
+                )
+            """)
+            conn.execute(
+                "INSERT INTO scheduled_transactions (user_id, transaction_type, tool_name, parameters, "
+                "schedule_type, schedule_config, created_at, next_execution) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ("u", "buy", "smart_buy", "{}", "once", "{}", "2024-01-01T00:00:00+00:00",
+                 "2024-01-01T00:00:01.5+00:00"),
+            )
+
+        await MemoryManager(db_path).initialize()
+
+        with sqlite3.connect(db_path) as conn:
+            (next_execution_us,) = conn.execute(
+                "SELECT next_execution_us FROM scheduled_transactions"
+            ).fetchone()
+        assert next_execution_us == 1704067201_500000
+
+    @pytest.mark.asyncio
+    async def test_epoch_column_backfilled_on_every_initialize(self, tmp_path):
+        """Test rows written without next_execution_us are filled in later, skipping bad values."""
+        import sqlite3
+
+        db_path = str(tmp_path / "shared.db")
+        await MemoryManager(db_path).initialize()
+
+        with sqlite3.connect(db_path) as conn:
+            for next_execution in ("2024-01-01T00:00:01.5+00:00", "not a timestamp"):
+                conn.execute(
+                    "INSERT INTO scheduled_transactions (user_id, transaction_type, tool_name, parameters, "
+                    "schedule_type, schedule_config, created_at, next_execution) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    ("u", "buy", "smart_buy", "{}", "once", "{}", "2024-01-01T00:00:00+00:00", next_execution),
+                )
+
+        await MemoryManager(db_path).initialize()
+
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute(
+                "SELECT next_execution_us FROM scheduled_transactions ORDER BY id"
+            ).fetchall()
+        assert rows == [(1704067201_500000,), (None,)]
+
+    @pytest.mark.asyncio
+    async def test_scheduler_queries_use_indexes(self, tmp_path):
+        """Test the due-time and listing queries are answered from indexes without sorting."""
+        import sqlite3
+
+        db_path = str(tmp_path / "plan.db")
+        await MemoryManager(db_path).initialize()
+
+        queries = [
+            ("SELECT * FROM scheduled_transactions WHERE status = 'pending' "
+             "AND next_execution_us <= ? ORDER BY next_execution_us LIMIT 500", (0,)),
+            ("SELECT MIN(next_execution_us) FROM scheduled_transactions "
+             "WHERE status = 'pending' AND next_execution_us IS NOT NULL", ()),
+            ("SELECT * FROM scheduled_transactions WHERE user_id = ? "
+             "ORDER BY created_at DESC LIMIT ? OFFSET ?", ("u", 50, 0)),
+            ("SELECT * FROM scheduled_transactions WHERE user_id = ? AND status = ? "
+             "ORDER BY created_at DESC LIMIT ? OFFSET ?", ("u", "pending", 50, 0)),
+        ]
+        with sqlite3.connect(db_path) as conn:
+            for query, params in queries:
+                plan = " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+                assert "USING" in plan and "INDEX" in plan, plan
+                assert "TEMP B-TREE" not in plan, plan
+
+    def test_writes_after_event_loop_closes(self, tmp_path, event_bus):
+        """Test a service started in one asyncio.run still writes from the next one."""
+        memory = MemoryManager(str(tmp_path / "loops.db"))
+        service = SchedulerService(memory, event_bus)
+
+        async def start():
+            await memory.initialize()
+            await service.start()
+
+        async def schedule():
+            await asyncio.wait_for(
+                service.schedule_transaction(
+                    "test_user",
+                    _buy_input(),
+                ),
+                timeout=5,
+            )
+            return await service.list_user_transactions("test_user")
+
+        asyncio.run(start())
+        assert len(asyncio.run(schedule())) == 1
+
+    def test_event_loop_shutdown_releases_connection(self, tmp_path, event_bus, tool_registry):
+        """Test the dedicated connection goes with its loop and the service restarts on another."""
+        memory = MemoryManager(str(tmp_path / "loops.db"))
+        service = SchedulerService(memory, event_bus)
+        service.set_tool_registry(tool_registry)
+
+        async def start():
+            await memory.initialize()
+            await service.start()
+
+        async def restart():
+            await service.start()
+            assert service._conn is not None
+            await asyncio.sleep(0.05)
+            await service.stop()
+
+        asyncio.run(start())
+        assert not service.running
+        assert service._conn is None and service._conn_stack is None
+
+        asyncio.run(asyncio.wait_for(restart(), timeout=5))
+        assert not service.running
+        assert service._conn is None
+
+    def test_monthly_recurrence_tracks_calendar_months(self, scheduler_service):
+        """Test monthly recurrence follows month lengths instead of 30-day steps."""
+        config = RecurringScheduleConfig(frequency="monthly")
+        start = datetime(2024, 1, 31, 9, 0, tzinfo=timezone.utc)
+
+        executions = scheduler_service._iter_recurring_executions(config, start)
+        assert [next(executions) for _ in range(3)] == [
+            datetime(2024, 2, 29, 9, 0, tzinfo=timezone.utc),
+            datetime(2024, 3, 29, 9, 0, tzinfo=timezone.utc),
+            datetime(2024, 4, 29, 9, 0, tzinfo=timezone.utc),
+        ]
+
+    def test_recurrence_stops_at_end_date(self, scheduler_service):
+        """Test recurring expansion honours end_date."""
+        config = RecurringScheduleConfig(
+            frequency="daily",
+            end_date=datetime(2024, 1, 3, tzinfo=timezone.utc),
+        )
+        start = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+        executions = list(scheduler_service._iter_recurring_executions(config, start))
+        assert executions == [datetime(2024, 1, 2, 12, 0, tzinfo=timezone.utc)]
+        assert scheduler_service._calculate_next_recurring_execution(config, executions[-1]) is None
+
+    def test_recurrence_steps_apply_time_of_day(self, scheduler_service):
+        """Test each frequency's step, including the configured time of day."""
+        start = datetime(2024, 1, 31, 15, 30, tzinfo=timezone.utc)
+        cases = [
+            (RecurringScheduleConfig(frequency="hourly"), datetime(2024, 1, 31, 16, 30)),
+            (RecurringScheduleConfig(frequency="daily", time="9:05"), datetime(2024, 2, 1, 9, 5)),
+            (RecurringScheduleConfig(frequency="weekly", days_of_week=[1], time="08:00"), datetime(2024, 2, 5, 8, 0)),
+            (RecurringScheduleConfig(frequency="weekly"), datetime(2024, 2, 7, 15, 30)),
+            (RecurringScheduleConfig(frequency="monthly", day_of_month=15), datetime(2024, 2, 15, 15, 30)),
+            (RecurringScheduleConfig(frequency="monthly", day_of_month=31, time="07:00"), datetime(2024, 2, 29, 7, 0)),
+        ]
+        for config, expected in cases:
+            assert scheduler_service._next_recurring_step(config, start) == expected.replace(tzinfo=timezone.utc)
+
+        # Day 31 resolves against each month in turn, including across the year end
+        config = RecurringScheduleConfig(frequency="monthly", day_of_month=31)
+        assert scheduler_service._next_recurring_step(
+            config, datetime(2024, 11, 30, 12, 0, tzinfo=timezone.utc)
+        ) == datetime(2024, 12, 31, 12, 0, tzinfo=timezone.utc)
+        assert scheduler_service._next_recurring_step(
+            config, datetime(2024, 12, 31, 12, 0, tzinfo=timezone.utc)
+        ) == datetime(2025, 1, 31, 12, 0, tzinfo=timezone.utc)
+
 
 class TestScheduledTransactionExecutor:
     """Test scheduled transaction executor."""
@@ -291,6 +983,32 @@ class TestScheduledTransactionExecutor:
         # Verify tool was called with correct parameters
         mock_tool.handler.assert_called_once_with({"mint": "test_mint", "amount_sol": 0.1})
 
+    @pytest.mark.asyncio
+    async def test_outcome_events_carry_iso_and_epoch_timestamps(self, executor, event_bus, mock_tool):
+        """Test outcome events keep the ISO timestamp alongside epoch milliseconds."""
+        executor.tool_registry.get_tool = MagicMock(return_value=mock_tool)
+        received = []
+
+        async def on_event(event, payload):
+            received.append(payload)
+
+        event_bus.subscribe("scheduler.transaction_executed", on_event)
+        transaction = ScheduledTransaction(
+            user_id="test_user",
+            transaction_type="buy",
+            tool_name="smart_buy",
+            parameters={"mint": "test_mint", "amount_sol": 0.1},
+            schedule_config=OnceScheduleConfig(execute_at=datetime.now(timezone.utc) + timedelta(hours=1)),
+        )
+
+        await executor.execute_transaction(transaction, validated=True)
+
+        [payload] = received
+        stamped = datetime.fromisoformat(payload["timestamp"])
+        assert stamped.tzinfo is not None
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        assert payload["timestamp_ms"] == (stamped - epoch) // timedelta(milliseconds=1)
+
     @pytest.mark.asyncio
     async def test_execute_transaction_tool_not_found(self, executor):
         """Test transaction execution when tool is not found."""
@@ -332,6 +1050,121 @@ class TestScheduledTransactionExecutor:
         assert "error" in result
         assert "Tool execution failed" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_execute_transaction_typed_result(self, executor, tool_registry):
+        """Test handlers returning ToolResult are checked by flag and returned as dicts."""
+        handler = AsyncMock(return_value=ToolResult(success=True, data={"signature": "abc"}))
+        _register_tool(tool_registry, handler, name="transfer_sol")
+        transaction = ScheduledTransaction(
+            user_id="test_user",
+            transaction_type="transfer",
+            tool_name="transfer_sol",
+            parameters={"to_address": "So11111111111111111111111111111111111111112", "amount": 1},
+            schedule_config=OnceScheduleConfig(execute_at=datetime.now(timezone.utc)),
+        )
+
+        result = await executor.execute_transaction(transaction)
+        assert result == {"signature": "abc", "success": True}
+
+        handler.return_value = ToolResult(success=False, error="insufficient funds")
+        result = await executor.execute_transaction(transaction)
+        assert result == {"error": "Tool execution failed: insufficient funds"}
+
+    @pytest.mark.asyncio
+    async def test_execute_transaction_skips_revalidation(self, executor, tool_registry):
+        """Test validation is skipped when the caller already ran the preflight."""
+        handler = AsyncMock(return_value={"success": True})
+        _register_tool(tool_registry, handler)
+        transaction = ScheduledTransaction(
+            user_id="test_user",
+            transaction_type="buy",
+            tool_name="smart_buy",
+            parameters={"mint": "short_mint", "amount_sol": 0.1},
+            schedule_config=OnceScheduleConfig(execute_at=datetime.now(timezone.utc)),
+        )
+
+        with patch.object(executor, "_validate_parameters", wraps=executor._validate_parameters) as validate:
+            result = await executor.execute_transaction(transaction)
+            assert "Invalid mint address format" in result["error"]
+            assert validate.call_count == 1
+
+            result = await executor.execute_transaction(transaction, validated=True)
+            assert result == {"success": True}
+            assert validate.call_count == 1
+        handler.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_outcome_events_batched_while_flusher_runs(self, executor, event_bus):
+        """Test queued outcome events are all published, in order, by the flusher."""
+        received = []
+
+        async def on_event(event, payload):
+            received.append((event, payload["transaction_id"]))
+
+        event_bus.subscribe("scheduler.transaction_executed", on_event)
+        event_bus.subscribe("scheduler.transaction_failed", on_event)
+
+        executor.start_event_flusher()
+        for i in range(5):
+            topic = "scheduler.transaction_executed" if i % 2 else "scheduler.transaction_failed"
+            await executor._emit(True, topic, {"transaction_id": i})
+        await executor.stop_event_flusher()
+
+        assert received == [
+            ("scheduler.transaction_failed", 0),
+            ("scheduler.transaction_executed", 1),
+            ("scheduler.transaction_failed", 2),
+            ("scheduler.transaction_executed", 3),
+            ("scheduler.transaction_failed", 4),
+        ]
+
+        # Without the flusher, events are delivered before _emit returns
+        await executor._emit(True, "scheduler.transaction_failed", {"transaction_id": 5})
+        assert received[-1] == ("scheduler.transaction_failed", 5)
+
+    @pytest.mark.asyncio
+    async def test_direct_execution_events_bypass_flusher_queue(self, executor, event_bus, mock_tool):
+        """Test executions outside the scheduler loop are not left in the flusher's queue."""
+        executor.tool_registry.get_tool = MagicMock(return_value=mock_tool)
+        received = []
+
+        async def on_event(event, payload):
+            received.append(event)
+
+        event_bus.subscribe("scheduler.transaction_executed", on_event)
+        transaction = ScheduledTransaction(
+            user_id="test_user",
+            transaction_type="buy",
+            tool_name="smart_buy",
+            parameters={"mint": "test_mint", "amount_sol": 0.1},
+            schedule_config=OnceScheduleConfig(execute_at=datetime.now(timezone.utc) + timedelta(hours=1)),
+        )
+
+        executor.start_event_flusher()
+        try:
+            await executor.execute_transaction(transaction, validated=True)
+            assert received == ["scheduler.transaction_executed"]
+            assert executor._events.empty()
+        finally:
+            await executor.stop_event_flusher()
+
+    def test_validate_addresses_by_decoded_length(self, executor):
+        """Test addresses are checked by decoded key length, not string length."""
+        # Wrapped SOL is a valid 43-character address
+        assert executor._validate_buy_parameters(
+            {"mint": "So11111111111111111111111111111111111111112", "amount_sol": 0.1}
+        ) is None
+
+        # 44 base58 characters that do not decode to 32 bytes
+        result = executor._validate_buy_parameters({"mint": "1" * 44, "amount_sol": 0.1})
+        assert "Invalid mint address format" in result["error"]
+
+        # Characters outside the base58 alphabet
+        result = executor._validate_transfer_parameters(
+            {"to_address": "0" * 44, "amount": 1}
+        )
+        assert "Invalid to_address format" in result["error"]
+
     def test_validate_buy_parameters(self, executor):
         """Test buy parameter validation."""
         # Valid parameters
@@ -441,6 +1274,69 @@ class TestSchedulerTools:
         assert "transactions" in result
         assert "count" in result
 
+    @pytest.mark.asyncio
+    async def test_list_scheduled_transactions_tool_terse(self, scheduler_tools, scheduler_service, tool_registry):
+        """Test verbose=False skips the human-readable time fields."""
+        list_tool = next(tool for tool in scheduler_tools if tool.spec.name == "list_scheduled_transactions")
+        scheduler_service.set_tool_registry(tool_registry)
+        set_scheduler_user_context(scheduler_service, "test_user")
+
+        await scheduler_service.schedule_transaction(
+            "test_user",
+            _buy_input(),
+        )
+
+        result = await list_tool.handler({"verbose": False})
+        assert result["success"] is True
+        [transaction] = result["transactions"]
+        assert transaction["next_execution"] is not None
+        assert transaction["next_execution_formatted"] is None
+        assert transaction["time_until_execution"] is None
+
+        result = await list_tool.handler({})
+        assert result["transactions"][0]["next_execution_formatted"] is not None
+
+    @pytest.mark.asyncio
+    async def test_schedule_transaction_tool_reports_resolved_time(
+        self, scheduler_tools, scheduler_service, tool_registry
+    ):
+        """Test the reply carries the execution time the config was resolved to."""
+        schedule_tool = next(tool for tool in scheduler_tools if tool.spec.name == "schedule_transaction")
+        scheduler_service.set_tool_registry(tool_registry)
+        set_scheduler_user_context(scheduler_service, "test_user")
+
+        result = await schedule_tool.handler({
+            "tool_name": "smart_buy",
+            "parameters": {"mint": "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v", "amount_sol": 0.1},
+            "schedule_type": "once",
+            "schedule_config": {"execute_at": "in 5 minutes"},
+        })
+        assert result["success"] is True
+        delay = datetime.fromisoformat(result["execution_time"]) - datetime.now(timezone.utc)
+        assert 290 < delay.total_seconds() <= 300
+        assert "Execution time:" in result["message"]
+        assert "Time until execution:" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_user_context_is_per_task(self, scheduler_tools, scheduler_service, tool_registry):
+        """Test concurrent runs for different users each list their own transactions."""
+        list_tool = next(tool for tool in scheduler_tools if tool.spec.name == "list_scheduled_transactions")
+        scheduler_service.set_tool_registry(tool_registry)
+
+        await scheduler_service.schedule_transaction(
+            "user_a",
+            _buy_input(),
+        )
+
+        async def list_as(user_id):
+            set_scheduler_user_context(scheduler_service, user_id)
+            await asyncio.sleep(0)
+            return await list_tool.handler({})
+
+        result_a, result_b = await asyncio.gather(list_as("user_a"), list_as("user_b"))
+        assert result_a["count"] == 1
+        assert result_b["count"] == 0
+
     @pytest.mark.asyncio
     async def test_cancel_scheduled_transaction_tool(self, scheduler_tools, tool_registry):
         """Test cancel scheduled transaction tool."""
@@ -458,6 +1354,46 @@ class TestSchedulerTools:
         assert result["success"] is False
         assert "not found" in result["error"]
 
+    def test_parse_time_expression(self):
+        """Test relative and absolute expressions parse through the combined pattern."""
+        now = datetime.now(timezone.utc)
+        relative = _parse_time_expression("In 2 Hours")
+        assert abs((relative - now).total_seconds() - 7200) < 1
+
+        absolute = _parse_time_expression("at 3:15 pm")
+        assert (absolute.hour, absolute.minute) == (15, 15)
+        assert now < absolute <= now + timedelta(days=1)
+
+        assert _parse_time_expression("next year") is None
+
+    def test_validate_and_fix_schedule_config(self):
+        """Test ISO, natural-language and unparseable execute_at strings."""
+        now = datetime.now(timezone.utc)
+        future = (now + timedelta(hours=1)).isoformat()
+        assert validate_and_fix_schedule_config("once", {"execute_at": future}) == {"execute_at": future}
+        future_z = future.replace("+00:00", "Z")
+        assert validate_and_fix_schedule_config("once", {"execute_at": future_z}) == {"execute_at": future_z}
+
+        naive = (now + timedelta(hours=1)).replace(tzinfo=None).isoformat()
+        fixed = validate_and_fix_schedule_config("once", {"execute_at": naive})
+        assert fixed == {"execute_at": naive + "+00:00"}
+
+        fixed = validate_and_fix_schedule_config("once", {"execute_at": "in 5 minutes"})
+        delay = datetime.fromisoformat(fixed["execute_at"]) - now
+        assert abs(delay.total_seconds() - 300) < 1
+
+        fixed = validate_and_fix_schedule_config("once", {"execute_at": "garbage"})
+        delay = datetime.fromisoformat(fixed["execute_at"]) - now
+        assert abs(delay.total_seconds() - 60) < 1
+
+    def test_to_24_hour(self):
+        """Test 12-hour clock conversion, including the noon and midnight edges."""
+        assert _to_24_hour(12, "am") == 0
+        assert _to_24_hour(12, "pm") == 12
+        assert _to_24_hour(1, "am") == 1
+        assert _to_24_hour(1, "pm") == 13
+        assert _to_24_hour(15, None) == 15
+
 
 class TestTimeHelpers:
     """Test time helper functions."""
@@ -486,6 +1422,12 @@ class TestTimeHelpers:
         assert execution_time.hour == 9
         assert execution_time.minute == 0
 
+    def test_calculate_execution_time_twelve_oclock(self):
+        """Test 12 AM and 12 PM map to midnight and noon."""
+        for expression, hour in (("at 12:15 AM", 0), ("at 12:15 PM", 12)):
+            execution_time = datetime.fromisoformat(calculate_execution_time(expression))
+            assert (execution_time.hour, execution_time.minute) == (hour, 15), expression
+
     def test_calculate_execution_time_tomorrow(self):
         """Test tomorrow time calculation."""
         # Test "tomorrow at 10:00"
@@ -527,6 +1469,17 @@ class TestTimeHelpers:
         result = get_time_until_execution(past_time)
         assert result == "Past due"
 
+    def test_time_helpers_accept_datetimes(self):
+        """Test the formatting helpers take datetimes without an ISO round trip."""
+        formatted = format_execution_time(datetime(2024, 1, 15, 14, 30, tzinfo=timezone.utc))
+        assert formatted == "2024-01-15 14:30:00 UTC"
+
+        result = get_time_until_execution(datetime.now(timezone.utc) + timedelta(minutes=5, seconds=30))
+        assert result == "5 minutes"
+
+        now = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        assert get_time_until_execution(now + timedelta(hours=2, minutes=30), now) == "2 hours and 30 minutes"
+
 
 class TestSchedulerIntegration:
     """Test scheduler integration with the full system."""
@@ -94,3 +94,26 @@ def test_tool_spec_serialization():
     spec_dict = tool_spec.model_dump()
     assert spec_dict["name"] == "test_tool"
     assert "input_schema" in spec_dict
+
+
+def test_register_many():
+    """Test registering several tools at once."""
+    registry = ToolRegistry()
+
+    async def handler(args):
+        return {}
+
+    registry.register_many(
+        Tool(
+            spec=ToolSpec(
+                name=name,
+                description=name,
+                input_schema={"parameters": {"type": "object", "properties": {}}},
+            ),
+            handler=handler,
+        )
+        for name in ("first_tool", "second_tool")
+    )
+
+    assert [spec["name"] for spec in registry.list_specs()] == ["first_tool", "second_tool"]
+    assert registry.get_tool("second_tool") is not None